@@ -3,10 +3,14 @@ Main Terraform Agent implementation.
 """
 
 import asyncio
+import hashlib
 import json
 import os
+import re
+from collections import OrderedDict, deque
+from itertools import chain, islice
 from pathlib import Path
-from typing import Dict, List, Optional, Any, AsyncGenerator
+from typing import Dict, List, Optional, Any, AsyncGenerator, Callable
 import structlog
 from rich.console import Console
 from rich.prompt import Prompt, Confirm
@@ -16,26 +20,134 @@ from rich.table import Table
 from rich.syntax import Syntax
 from datetime import datetime
 
+try:
+    import orjson
+
+    def _json_pretty(obj) -> str:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2, default=str).decode()
+except ImportError:
+    def _json_pretty(obj) -> str:
+        return json.dumps(obj, indent=2, default=str)
+
 from .config import get_config
 from .exceptions import AgentError, ApprovalError
 from ..models.ollama_client import get_ollama_client, OllamaClient
 from ..git.repository import get_repository, GitRepository
-from ..terraform.parser import get_analyzer, TerraformAnalyzer
+from ..terraform.parser import get_analyzer, TerraformAnalyzer, iter_terraform_paths
 
 logger = structlog.get_logger(__name__)
 console = Console()
 
+# Patterns for the response-parsing hot path, compiled once at import.
+# google-re2 scans in linear time regardless of response size; these
+# patterns avoid backreferences and lookarounds so it stays a drop-in
+try:
+    import re2 as _re
+except ImportError:
+    _re = re
+
+_CODE_BLOCK_RE = _re.compile(r'```(?:terraform|hcl)\n(.*?)\n```', re.DOTALL)
+_ANY_CODE_BLOCK_RE = _re.compile(r'```(?:hcl|terraform)?\n(.*?)\n```', re.DOTALL)
+# One case-insensitive alternation buckets review lines by lastgroup in
+# a single search, with no lowercased copy of each line
+_CATEGORY_RE = re.compile(
+    r'(?P<suggestions>suggest|recommend|consider|should)'
+    r'|(?P<issues>issue|problem|error|warning|security risk)'
+    r'|(?P<improvements>improve|optimize|enhance|better)',
+    re.IGNORECASE
+)
+
+# Directory analyses kept per agent, evicted least-recently-used
+_ANALYSIS_CACHE_SIZE = 8
+
+# Generated responses persisted across sessions, content-addressed by
+# prompt hash so re-reviewing unchanged files skips inference entirely
+_RESPONSE_CACHE_DIR = Path.home() / '.cache' / 'x-terraform' / 'resp'
+
+# Responses kept in memory per agent, evicted least-recently-used
+_RESPONSE_CACHE_SIZE = 64
+
+# On-disk response entries kept; the oldest-accessed beyond this are
+# removed on store so the cache directory cannot grow without bound
+_RESPONSE_CACHE_DISK_LIMIT = 256
+
+# Static agent metadata shared by every context build
+_AGENT_INFO = {
+    "name": "X-Terraform Agent",
+    "version": "0.0.1",
+    "release_date": "2024-06-22",
+    "capabilities": [
+        "Terraform code generation and analysis",
+        "Local file processing (no git required)",
+        "Configuration validation and best practices",
+        "Code review and suggestions",
+        "Infrastructure planning and optimization",
+        "Error diagnosis and fixes",
+        "Latest Terraform documentation integration"
+    ],
+    "supported_terraform_version": ">= 1.0",
+    "documentation_source": "https://developer.hashicorp.com/terraform",
+    "documentation_last_updated": "2024-06-22"
+}
+
+
+def _render_system_prompt(agent_info: Dict[str, Any]) -> str:
+    """Render the system prompt once; agent_info is static metadata."""
+    return f"""You are {agent_info.get('name', 'Terraform Agent')} version {agent_info.get('version', '1.0.0')}, an AI-powered assistant for Terraform infrastructure as code.
+
+CAPABILITIES:
+{chr(10).join(f"- {cap}" for cap in agent_info.get('capabilities', []))}
+
+TERRAFORM KNOWLEDGE:
+- You have access to the latest Terraform documentation from {agent_info.get('documentation_source', 'https://developer.hashicorp.com/terraform')}
+- Documentation is current as of {agent_info.get('documentation_last_updated', '2024-06-22')}
+- You understand Terraform {agent_info.get('supported_terraform_version', '>= 1.0')} syntax and best practices
+- You can analyze, validate, and suggest improvements for Terraform configurations
+
+RESPONSE FORMAT:
+1. Provide clear, actionable advice
+2. Reference specific Terraform documentation when applicable
+3. Include code examples when helpful
+4. Suggest best practices and security considerations
+5. If suggesting changes, provide the complete updated code
+6. Always explain the reasoning behind your suggestions
+
+CODE REVIEW GUIDELINES:
+- Check for security best practices
+- Validate syntax and structure
+- Suggest performance optimizations
+- Ensure proper resource naming conventions
+- Verify provider configurations
+- Check for potential cost optimizations
+
+When analyzing Terraform code, always provide:
+1. Summary of what the code does
+2. Potential issues or improvements
+3. Best practices recommendations
+4. Security considerations
+5. Cost optimization suggestions (if applicable)
+
+Be helpful, accurate, and follow HashiCorp's official Terraform best practices."""
+
 
 class TerraformAgent:
     """Main Terraform Agent class."""
     
     def __init__(self):
         self.config = get_config()
+        # Config is immutable after startup; serialize it for context once
+        self._config_dict = self.config.to_dict()
         self.ollama_client: Optional[OllamaClient] = None
         self.repository: Optional[GitRepository] = None
         self.analyzer: Optional[TerraformAnalyzer] = None
-        self.conversation_history: List[Dict[str, str]] = []
+        # Bounded: old exchanges are evicted automatically so long
+        # sessions do not grow memory without limit
+        self.conversation_history: deque = deque(maxlen=self.config.history_limit)
         self.current_directory: Optional[str] = None
+        self._analysis_cache: "OrderedDict[tuple, Dict[str, Any]]" = OrderedDict()
+        self._system_prompt = _render_system_prompt(_AGENT_INFO)
+        self._response_cache: "OrderedDict[str, str]" = OrderedDict()
+        self._inflight: Dict[str, asyncio.Future] = {}
         
         # Initialize components
         self._initialize_components()
@@ -63,7 +175,13 @@ class TerraformAgent:
         """Start the agent and initialize Ollama connection."""
         try:
             self.ollama_client = await get_ollama_client()
-            
+
+            # Size the HTTP pool before the first request opens the session
+            self.ollama_client.configure_pool(
+                self.config.http_max_connections,
+                self.config.http_keepalive_timeout
+            )
+
             # Check if Ollama is healthy
             if not await self.ollama_client.health_check():
                 raise AgentError("Ollama is not healthy")
@@ -91,20 +209,25 @@ class TerraformAgent:
         logger.info(f"Working directory set to: {directory}")
     
     async def process_query(
-        self, 
-        query: str, 
+        self,
+        query: str,
         context: Optional[Dict[str, Any]] = None,
-        require_approval: Optional[bool] = None
+        require_approval: Optional[bool] = None,
+        on_token: Optional[Callable[[str], None]] = None
     ) -> Dict[str, Any]:
-        """Process a user query and return a response."""
+        """Process a user query and return a response.
+
+        When on_token is given, response tokens are forwarded to it as
+        they arrive from the model instead of surfacing only at the end.
+        """
         try:
             require_approval = require_approval if require_approval is not None else self.config.require_approval
-            
+
             # Build context
             full_context = await self._build_context(context)
-            
+
             # Generate AI response
-            response = await self._generate_response(query, full_context)
+            response = await self._generate_response(query, full_context, on_token=on_token)
             
             # Parse response for actions
             actions = self._parse_actions(response)
@@ -119,12 +242,13 @@ class TerraformAgent:
             else:
                 results = {}
             
-            # Update conversation history
+            # Update conversation history; it only ever feeds prompt
+            # construction, so keep truncated text and drop the (often
+            # large) actions/results payloads, which the caller gets back
+            limit = self.config.history_turn_chars
             self.conversation_history.append({
-                "user": query,
-                "assistant": response,
-                "actions": actions,
-                "results": results
+                "user": query[:limit],
+                "assistant": response[:limit]
             })
             
             return {
@@ -146,36 +270,36 @@ class TerraformAgent:
     async def _build_context(self, additional_context: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """Build comprehensive context for the AI model."""
         context = {
-            "agent_info": {
-                "name": "X-Terraform Agent",
-                "version": "0.0.1",
-                "release_date": "2024-06-22",
-                "capabilities": [
-                    "Terraform code generation and analysis",
-                    "Local file processing (no git required)",
-                    "Configuration validation and best practices",
-                    "Code review and suggestions",
-                    "Infrastructure planning and optimization",
-                    "Error diagnosis and fixes",
-                    "Latest Terraform documentation integration"
-                ],
-                "supported_terraform_version": ">= 1.0",
-                "documentation_source": "https://developer.hashicorp.com/terraform",
-                "documentation_last_updated": "2024-06-22"
-            },
-            "configuration": self.config.to_dict(),
-            "conversation_history": self.conversation_history[-5:],  # Last 5 exchanges
+            "agent_info": _AGENT_INFO,
+            "configuration": self._config_dict,
+            # Last 5 exchanges; islice avoids slicing a copy of the deque
+            "conversation_history": list(islice(
+                self.conversation_history,
+                max(0, len(self.conversation_history) - 5),
+                None
+            )),
         }
         
+        # Each directory is analyzed at most once per context build
+        analyzed_dir = None
+
         # Add local file context (works without git)
         if self.current_directory:
             try:
-                context["local_files"] = self._get_local_terraform_files()
-                
-                # Analyze current directory
-                analysis = self.analyzer.analyze_directory(self.current_directory)
+                # One walk and one read per file, shared between the
+                # prompt context and the analyzer
+                directory = Path(self.current_directory)
+                walked = await self._walk_terraform(directory) if directory.exists() else []
+                context["local_files"] = await self._get_local_terraform_files(walked)
+
+                # Analyze current directory off the event loop; HCL
+                # parsing is CPU-bound and would stall concurrent I/O
+                analysis = await asyncio.to_thread(
+                    self._analyze_cached, self.current_directory, walked
+                )
                 context["terraform_analysis"] = analysis
-                
+                analyzed_dir = os.path.realpath(self.current_directory)
+
             except Exception as e:
                 logger.warning(f"Failed to build local file context: {e}")
         
@@ -189,9 +313,11 @@ class TerraformAgent:
                 if terraform_files:
                     context["terraform_files"] = terraform_files
                     
-                    # Analyze current directory
-                    if self.repository.repo_path:
-                        analysis = self.analyzer.analyze_directory(str(self.repository.repo_path))
+                    # Analyze the repo root unless the working-directory
+                    # branch above already covered the same path
+                    repo_dir = str(self.repository.repo_path) if self.repository.repo_path else None
+                    if repo_dir and os.path.realpath(repo_dir) != analyzed_dir:
+                        analysis = await asyncio.to_thread(self._analyze_cached, repo_dir)
                         context["terraform_analysis"] = analysis
                         
             except Exception as e:
@@ -203,154 +329,299 @@ class TerraformAgent:
         
         return context
     
-    def _get_local_terraform_files(self) -> Dict[str, Any]:
+    def _analyze_cached(self, directory: str, walked: Optional[List[tuple]] = None) -> Dict[str, Any]:
+        """Analyze a directory, reusing results while its .tf files are unchanged.
+
+        Keyed on the newest .tf mtime so repeated queries against an
+        untouched tree skip the parse entirely; any edit changes the key.
+        When the caller already walked the tree, the read contents are
+        handed to the analyzer so files are not read twice.
+        """
+        path = Path(directory)
+        if not path.exists():
+            # Drop stale entries for directories that no longer exist
+            for key in [k for k in self._analysis_cache if k[0] == directory]:
+                del self._analysis_cache[key]
+            return self.analyzer.analyze_directory(directory)
+
+        if walked is not None:
+            newest = max((p.stat().st_mtime for p, _ in walked), default=0.0)
+        else:
+            newest = max((p.stat().st_mtime for p in iter_terraform_paths(path)), default=0.0)
+        key = (directory, newest)
+        cached = self._analysis_cache.get(key)
+        if cached is not None:
+            self._analysis_cache.move_to_end(key)
+            return cached
+
+        if walked is not None:
+            analysis = self.analyzer.analyze_contents(directory, walked)
+        else:
+            analysis = self.analyzer.analyze_directory(directory)
+        self._analysis_cache[key] = analysis
+        if len(self._analysis_cache) > _ANALYSIS_CACHE_SIZE:
+            self._analysis_cache.popitem(last=False)
+        return analysis
+
+    async def _walk_terraform(self, directory: Path) -> List[tuple]:
+        """One walk and one concurrent read per Terraform file under directory.
+
+        Returns (path, content) pairs covering .tf and .tfvars files; reads
+        run via asyncio.to_thread so disk latency overlaps across files
+        instead of blocking the event loop one file at a time.
+        """
+        paths = list(iter_terraform_paths(directory, ('.tf', '.tfvars')))
+        contents = await asyncio.gather(
+            *(asyncio.to_thread(p.read_text, encoding='utf-8') for p in paths),
+            return_exceptions=True
+        )
+
+        files = []
+        for file_path, content in zip(paths, contents):
+            if isinstance(content, BaseException):
+                logger.warning(f"Failed to read file {file_path}: {content}")
+                continue
+            files.append((file_path, content))
+        return files
+
+    async def _get_local_terraform_files(self, walked: Optional[List[tuple]] = None) -> Dict[str, Any]:
         """Get Terraform files from local directory."""
         if not self.current_directory:
             return {}
-        
+
         directory = Path(self.current_directory)
         if not directory.exists():
             return {}
-        
+
+        if walked is None:
+            walked = await self._walk_terraform(directory)
+
+        # Cap what gets embedded into prompts: huge files are clipped to
+        # head and tail, and past the cumulative budget only metadata is
+        # kept, so one multi-MB .tf file cannot blow the token window
+        max_file = self.config.max_file_bytes
+        budget = self.config.max_context_bytes
+        total = 0
+
         terraform_files = []
-        for file_path in directory.rglob("*.tf"):
-            try:
-                content = file_path.read_text(encoding='utf-8')
-                terraform_files.append({
-                    "path": str(file_path),
-                    "name": file_path.name,
-                    "size": len(content),
-                    "content": content,
-                    "relative_path": str(file_path.relative_to(directory))
-                })
-            except Exception as e:
-                logger.warning(f"Failed to read file {file_path}: {e}")
-        
+        for file_path, content in walked:
+            if file_path.suffix != '.tf':
+                continue
+            size = len(content)
+            if total >= budget:
+                content = f"... [content omitted: {size} bytes over context budget] ..."
+            elif size > max_file:
+                half = max_file // 2
+                content = (
+                    content[:half]
+                    + f"\n... [truncated {size - max_file} bytes] ...\n"
+                    + content[-half:]
+                )
+                total += max_file
+            else:
+                total += size
+            terraform_files.append({
+                "path": str(file_path),
+                "name": file_path.name,
+                "size": size,
+                "content": content,
+                "relative_path": str(file_path.relative_to(directory))
+            })
+
         return {
             "directory": str(directory),
             "files": terraform_files,
             "total_files": len(terraform_files)
         }
     
-    async def _generate_response(self, query: str, context: Dict[str, Any]) -> str:
+    async def _generate_response(
+        self,
+        query: str,
+        context: Dict[str, Any],
+        on_token: Optional[Callable[[str], None]] = None
+    ) -> str:
         """Generate AI response using Ollama."""
         try:
-            # Build system prompt
-            system_prompt = self._build_system_prompt(context)
-            
+            # System prompt is static and rendered once at __init__
+            system_prompt = self._system_prompt
+
             # Build user prompt
             user_prompt = self._build_user_prompt(query, context)
-            
-            # Generate response
-            response = await self.ollama_client.generate(
-                prompt=user_prompt,
-                system_prompt=system_prompt,
-                temperature=self.config.temperature,
-                max_tokens=self.config.max_tokens
-            )
-            
+
+            # The prompt now owns the file contents; drop the duplicate
+            # copies so the context dict returned to callers (and kept in
+            # history) holds metadata only
+            local_files = context.get("local_files")
+            if local_files:
+                for file_info in local_files.get("files", []):
+                    file_info.pop("content", None)
+
+            # Identical prompts (same file contents, model, temperature)
+            # are served from cache instead of re-running inference
+            cache_key = self._response_cache_key(system_prompt, user_prompt)
+            cached = self._cached_response(cache_key)
+            if cached is not None:
+                if on_token is not None:
+                    on_token(cached)
+                return cached
+
+            # Streaming: surface tokens as they arrive so the first words
+            # show up sub-second instead of after the full generation
+            if on_token is not None:
+                parts: List[str] = []
+                async for token in self.ollama_client.generate_stream(
+                    prompt=user_prompt,
+                    system_prompt=system_prompt,
+                    temperature=self.config.temperature,
+                    max_tokens=self.config.max_tokens
+                ):
+                    parts.append(token)
+                    on_token(token)
+                response = ''.join(parts)
+                self._store_response(cache_key, response)
+                return response
+
+            # Single-flight: concurrent callers with an identical prompt
+            # (e.g. parallel reviews of similar files) await the one
+            # in-flight generation instead of issuing duplicates
+            existing = self._inflight.get(cache_key)
+            if existing is not None:
+                return await existing
+
+            fut = asyncio.get_running_loop().create_future()
+            self._inflight[cache_key] = fut
+            try:
+                # Generate response
+                response = await self.ollama_client.generate(
+                    prompt=user_prompt,
+                    system_prompt=system_prompt,
+                    temperature=self.config.temperature,
+                    max_tokens=self.config.max_tokens
+                )
+                self._store_response(cache_key, response)
+                fut.set_result(response)
+            except BaseException as e:
+                fut.set_exception(e)
+                fut.exception()  # waiters re-raise; mark retrieved here
+                raise
+            finally:
+                self._inflight.pop(cache_key, None)
+
             return response
             
         except Exception as e:
             logger.error(f"Failed to generate response: {e}")
             raise AgentError(f"Response generation failed: {e}")
     
-    def _build_system_prompt(self, context: Dict[str, Any]) -> str:
-        """Build system prompt for the AI model."""
-        agent_info = context.get("agent_info", {})
-        
-        system_prompt = f"""You are {agent_info.get('name', 'Terraform Agent')} version {agent_info.get('version', '1.0.0')}, an AI-powered assistant for Terraform infrastructure as code.
+    def _response_cache_key(self, system_prompt: str, user_prompt: str) -> str:
+        """Content hash of everything that determines a generation.
 
-CAPABILITIES:
-{chr(10).join(f"- {cap}" for cap in agent_info.get('capabilities', []))}
+        File contents are embedded in the user prompt, so edits bust the
+        key without any separate invalidation bookkeeping.
+        """
+        h = hashlib.blake2b(digest_size=16)
+        h.update(system_prompt.encode())
+        h.update(user_prompt.encode())
+        h.update(f"{self.config.agent_model}|{self.config.temperature}".encode())
+        return h.hexdigest()
 
-TERRAFORM KNOWLEDGE:
-- You have access to the latest Terraform documentation from {agent_info.get('documentation_source', 'https://developer.hashicorp.com/terraform')}
-- Documentation is current as of {agent_info.get('documentation_last_updated', '2024-06-22')}
-- You understand Terraform {agent_info.get('supported_terraform_version', '>= 1.0')} syntax and best practices
-- You can analyze, validate, and suggest improvements for Terraform configurations
+    def _cached_response(self, key: str) -> Optional[str]:
+        """Look up a generated response in memory, then on disk."""
+        response = self._response_cache.get(key)
+        if response is not None:
+            self._response_cache.move_to_end(key)
+            return response
+        try:
+            response = (_RESPONSE_CACHE_DIR / key).read_text(encoding='utf-8')
+        except OSError:
+            return None
+        self._remember_response(key, response)
+        return response
 
-RESPONSE FORMAT:
-1. Provide clear, actionable advice
-2. Reference specific Terraform documentation when applicable
-3. Include code examples when helpful
-4. Suggest best practices and security considerations
-5. If suggesting changes, provide the complete updated code
-6. Always explain the reasoning behind your suggestions
+    def _remember_response(self, key: str, response: str):
+        """Insert into the in-memory LRU, evicting the least recently used."""
+        self._response_cache[key] = response
+        self._response_cache.move_to_end(key)
+        if len(self._response_cache) > _RESPONSE_CACHE_SIZE:
+            self._response_cache.popitem(last=False)
 
-CODE REVIEW GUIDELINES:
-- Check for security best practices
-- Validate syntax and structure
-- Suggest performance optimizations
-- Ensure proper resource naming conventions
-- Verify provider configurations
-- Check for potential cost optimizations
+    def _store_response(self, key: str, response: str):
+        """Store a generated response in memory and on disk."""
+        self._remember_response(key, response)
+        try:
+            _RESPONSE_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            (_RESPONSE_CACHE_DIR / key).write_text(response, encoding='utf-8')
+            self._prune_response_dir()
+        except OSError as e:
+            logger.warning(f"Failed to persist response cache entry: {e}")
 
-When analyzing Terraform code, always provide:
-1. Summary of what the code does
-2. Potential issues or improvements
-3. Best practices recommendations
-4. Security considerations
-5. Cost optimization suggestions (if applicable)
+    @staticmethod
+    def _prune_response_dir():
+        """Drop the oldest-accessed on-disk entries past the count cap."""
+        with os.scandir(_RESPONSE_CACHE_DIR) as entries:
+            on_disk = [
+                (entry.stat().st_atime, entry.path)
+                for entry in entries if entry.is_file()
+            ]
+        if len(on_disk) <= _RESPONSE_CACHE_DISK_LIMIT:
+            return
+        on_disk.sort()
+        for _, stale_path in on_disk[:len(on_disk) - _RESPONSE_CACHE_DISK_LIMIT]:
+            try:
+                os.unlink(stale_path)
+            except OSError:
+                continue
 
-Be helpful, accurate, and follow HashiCorp's official Terraform best practices."""
-        
-        return system_prompt
-    
     def _build_user_prompt(self, query: str, context: Dict[str, Any]) -> str:
         """Build user prompt with context."""
-        prompt = f"User Query: {query}\n\n"
-        
+        # Collect fragments and join once; += on large file contents
+        # reallocates the growing prompt string on every append
+        parts = [f"User Query: {query}\n\n"]
+
         # Add local file context
         if "local_files" in context:
             local_files = context["local_files"]
-            prompt += f"WORKING DIRECTORY: {local_files.get('directory', 'Not set')}\n"
-            prompt += f"TERRAFORM FILES FOUND: {local_files.get('total_files', 0)}\n\n"
-            
+            parts.append(f"WORKING DIRECTORY: {local_files.get('directory', 'Not set')}\n")
+            parts.append(f"TERRAFORM FILES FOUND: {local_files.get('total_files', 0)}\n\n")
+
             for file_info in local_files.get("files", []):
-                prompt += f"FILE: {file_info['relative_path']}\n"
-                prompt += f"CONTENT:\n{file_info['content']}\n\n"
-        
+                parts.append(f"FILE: {file_info['relative_path']}\n")
+                parts.append(f"CONTENT:\n{file_info['content']}\n\n")
+
         # Add analysis context
         if "terraform_analysis" in context:
             analysis = context["terraform_analysis"]
-            prompt += f"ANALYSIS SUMMARY:\n"
-            prompt += f"- Total files: {analysis.get('total_files', 0)}\n"
-            prompt += f"- Resources: {len(analysis.get('resources', []))}\n"
-            prompt += f"- Providers: {len(analysis.get('providers', []))}\n"
-            prompt += f"- Variables: {len(analysis.get('variables', []))}\n"
-            prompt += f"- Outputs: {len(analysis.get('outputs', []))}\n\n"
-        
+            parts.append("ANALYSIS SUMMARY:\n")
+            parts.append(f"- Total files: {analysis.get('total_files', 0)}\n")
+            parts.append(f"- Resources: {len(analysis.get('resources', []))}\n")
+            parts.append(f"- Providers: {len(analysis.get('providers', []))}\n")
+            parts.append(f"- Variables: {len(analysis.get('variables', []))}\n")
+            parts.append(f"- Outputs: {len(analysis.get('outputs', []))}\n\n")
+
         # Add conversation history
         if context.get("conversation_history"):
-            prompt += "CONVERSATION HISTORY:\n"
+            parts.append("CONVERSATION HISTORY:\n")
             for exchange in context["conversation_history"]:
-                prompt += f"User: {exchange.get('user', '')}\n"
-                prompt += f"Assistant: {exchange.get('assistant', '')}\n\n"
-        
-        return prompt
+                parts.append(f"User: {exchange.get('user', '')}\n")
+                parts.append(f"Assistant: {exchange.get('assistant', '')}\n\n")
+
+        return ''.join(parts)
     
     def _parse_actions(self, response: str) -> List[Dict[str, Any]]:
         """Parse actions from AI response."""
-        actions = []
-        
         # Look for action markers in the response
         # This is a simple implementation - in production, you might want more sophisticated parsing
-        
-        # Check for file creation/modification patterns
-        if "```terraform" in response or "```hcl" in response:
-            # Extract code blocks
-            import re
-            code_blocks = re.findall(r'```(?:terraform|hcl)\n(.*?)\n```', response, re.DOTALL)
-            
-            for i, code in enumerate(code_blocks):
-                actions.append({
-                    "type": "code_generation",
-                    "content": code,
-                    "description": f"Generated Terraform code block {i+1}"
-                })
-        
-        return actions
+
+        # One finditer pass over the response; the previous substring
+        # guards scanned the whole string twice before the regex ran
+        return [
+            {
+                "type": "code_generation",
+                "content": match.group(1),
+                "description": f"Generated Terraform code block {i+1}"
+            }
+            for i, match in enumerate(_CODE_BLOCK_RE.finditer(response))
+        ]
     
     async def _request_approval(self, actions: List[Dict[str, Any]], response: str) -> bool:
         """Request user approval for actions."""
@@ -408,7 +679,7 @@ Be helpful, accurate, and follow HashiCorp's official Terraform best practices."
             if not Path(directory).exists():
                 raise AgentError(f"Directory not found: {directory}")
             
-            analysis = self.analyzer.analyze_directory(directory)
+            analysis = await asyncio.to_thread(self.analyzer.analyze_directory, directory)
             return analysis
             
         except Exception as e:
@@ -418,7 +689,7 @@ Be helpful, accurate, and follow HashiCorp's official Terraform best practices."
     async def validate_terraform_file(self, file_path: str) -> Dict[str, Any]:
         """Validate a specific Terraform file."""
         try:
-            validation = self.analyzer.validate_configuration(file_path)
+            validation = await asyncio.to_thread(self.analyzer.validate_configuration, file_path)
             return validation
             
         except Exception as e:
@@ -466,16 +737,15 @@ Be helpful, accurate, and follow HashiCorp's official Terraform best practices."
                     await self._show_analysis()
                     continue
                 
-                # Process the query
-                result = await self.process_query(query)
-                
+                # Process the query, echoing tokens as they stream in
+                def _print_token(token: str):
+                    console.print(token, end="", markup=False, highlight=False)
+
+                result = await self.process_query(query, on_token=_print_token)
+                console.print()  # finish the streamed line
+
                 if "error" in result:
                     console.print(f"[red]Error: {result['error']}[/red]")
-                else:
-                    console.print(Panel(
-                        result["response"],
-                        title="🤖 Agent Response"
-                    ))
                 
             except KeyboardInterrupt:
                 console.print("\n[yellow]Interrupted by user[/yellow]")
@@ -507,7 +777,7 @@ You can also ask questions like:
         """Show current status."""
         status = await self.get_repository_status()
         console.print(Panel(
-            json.dumps(status, indent=2),
+            _json_pretty(status),
             title="Repository Status"
         ))
     
@@ -515,7 +785,7 @@ You can also ask questions like:
         """Show Terraform analysis."""
         analysis = await self.analyze_terraform_files()
         console.print(Panel(
-            json.dumps(analysis.get("summary", {}), indent=2),
+            _json_pretty(analysis.get("summary", {})),
             title="Terraform Analysis"
         ))
     
@@ -545,7 +815,7 @@ You can also ask questions like:
             raise AgentError("No working directory set")
         
         directory = Path(self.current_directory)
-        terraform_files = list(directory.rglob("*.tf"))
+        terraform_files = list(iter_terraform_paths(directory))
         
         if not terraform_files:
             return {
@@ -555,22 +825,22 @@ You can also ask questions like:
                 "improvements": []
             }
         
-        all_suggestions = []
-        all_issues = []
-        all_improvements = []
-        
-        for file_path in terraform_files:
-            file_review = await self._review_single_file(str(file_path))
-            all_suggestions.extend(file_review.get("suggestions", []))
-            all_issues.extend(file_review.get("issues", []))
-            all_improvements.extend(file_review.get("improvements", []))
-        
+        # Fan reviews out concurrently; the semaphore keeps the number of
+        # in-flight model requests aligned with what the server can take
+        sem = asyncio.Semaphore(self.config.max_concurrent_reviews)
+
+        async def _bounded(path: Path) -> Dict[str, Any]:
+            async with sem:
+                return await self._review_single_file(str(path))
+
+        reviews = await asyncio.gather(*(_bounded(p) for p in terraform_files))
+
         return {
             "directory": str(directory),
             "files_reviewed": len(terraform_files),
-            "suggestions": all_suggestions,
-            "issues": all_issues,
-            "improvements": all_improvements
+            "suggestions": list(chain.from_iterable(r.get("suggestions", []) for r in reviews)),
+            "issues": list(chain.from_iterable(r.get("issues", []) for r in reviews)),
+            "improvements": list(chain.from_iterable(r.get("improvements", []) for r in reviews))
         }
     
     async def _review_single_file(self, file_path: str) -> Dict[str, Any]:
@@ -582,8 +852,9 @@ You can also ask questions like:
             
             content = file_path_obj.read_text(encoding='utf-8')
             
-            # Analyze the file
-            analysis = self.analyzer.validate_configuration(file_path)
+            # Analyze the file off the event loop so concurrent reviews
+            # keep their HTTP requests in flight
+            analysis = await asyncio.to_thread(self.analyzer.validate_configuration, file_path)
             
             # Generate review using AI
             review_query = f"Please review this Terraform file and provide suggestions for improvements, security best practices, and potential issues:\n\n{content}"
@@ -595,18 +866,16 @@ You can also ask questions like:
             }
             
             response = await self._generate_response(review_query, context)
-            
+
             # Parse the response for structured feedback
-            suggestions = self._extract_suggestions(response)
-            issues = self._extract_issues(response)
-            improvements = self._extract_improvements(response)
-            
+            categories = self._categorize_response(response)
+
             return {
                 "file_path": file_path,
                 "file_size": len(content),
-                "suggestions": suggestions,
-                "issues": issues,
-                "improvements": improvements,
+                "suggestions": categories["suggestions"],
+                "issues": categories["issues"],
+                "improvements": categories["improvements"],
                 "analysis": analysis,
                 "ai_review": response
             }
@@ -621,32 +890,23 @@ You can also ask questions like:
                 "improvements": []
             }
     
-    def _extract_suggestions(self, response: str) -> List[str]:
-        """Extract suggestions from AI response."""
-        suggestions = []
-        lines = response.split('\n')
-        for line in lines:
-            if any(keyword in line.lower() for keyword in ['suggest', 'recommend', 'consider', 'should']):
-                suggestions.append(line.strip())
-        return suggestions
-    
-    def _extract_issues(self, response: str) -> List[str]:
-        """Extract issues from AI response."""
-        issues = []
-        lines = response.split('\n')
-        for line in lines:
-            if any(keyword in line.lower() for keyword in ['issue', 'problem', 'error', 'warning', 'security risk']):
-                issues.append(line.strip())
-        return issues
-    
-    def _extract_improvements(self, response: str) -> List[str]:
-        """Extract improvements from AI response."""
-        improvements = []
-        lines = response.split('\n')
-        for line in lines:
-            if any(keyword in line.lower() for keyword in ['improve', 'optimize', 'enhance', 'better']):
-                improvements.append(line.strip())
-        return improvements
+    def _categorize_response(self, response: str) -> Dict[str, List[str]]:
+        """Bucket review lines into suggestions/issues/improvements.
+
+        One split over the response and a single case-insensitive search
+        per line; no temporary lowercased copies are allocated.
+        """
+        categories: Dict[str, List[str]] = {
+            "suggestions": [],
+            "issues": [],
+            "improvements": []
+        }
+        search = _CATEGORY_RE.search
+        for line in response.split('\n'):
+            match = search(line)
+            if match:
+                categories[match.lastgroup].append(line.strip())
+        return categories
     
     async def suggest_fixes(self, file_path: str, issue_description: str) -> Dict[str, Any]:
         """Suggest fixes for specific issues in a Terraform file."""
@@ -727,12 +987,16 @@ You can also ask questions like:
                         "message": "User cancelled the operation"
                     }
             
-            # Create backup
+            # Create backup as a hard link: an O(1) metadata op that never
+            # removes the original from its expected path
             backup_path = f"{file_path}.backup.{datetime.now().strftime('%Y%m%d_%H%M%S')}"
-            file_path_obj.rename(backup_path)
-            
-            # Write updated content
-            file_path_obj.write_text(updated_code, encoding='utf-8')
+            os.link(file_path, backup_path)
+
+            # Write to a temp file and swap it in atomically so a failed
+            # write cannot leave the file missing or half-written
+            tmp_path = f"{file_path}.tmp"
+            Path(tmp_path).write_text(updated_code, encoding='utf-8')
+            os.replace(tmp_path, file_path)
             
             return {
                 "success": True,
@@ -752,13 +1016,22 @@ You can also ask questions like:
     
     def _extract_code_from_response(self, response: str) -> str:
         """Extract code blocks from AI response."""
-        # Look for code blocks marked with ```
-        import re
-        code_blocks = re.findall(r'```(?:hcl|terraform)?\n(.*?)\n```', response, re.DOTALL)
+        # Only the first block matters, so locate its fences with str.find
+        # instead of regex-scanning the whole response
+        i = response.find('```')
+        if i < 0:
+            # If no code blocks, try to extract the entire response
+            return response.strip()
+        j = response.find('\n', i)
+        if j >= 0 and response[i + 3:j] in ('', 'hcl', 'terraform'):
+            k = response.find('\n```', j + 1)
+            if k >= 0:
+                return response[j + 1:k].strip()
+        # Odd fencing (tagged with another language, unterminated, ...);
+        # fall back to the full pattern
+        code_blocks = _ANY_CODE_BLOCK_RE.findall(response)
         if code_blocks:
             return code_blocks[0].strip()
-        
-        # If no code blocks, try to extract the entire response
         return response.strip()
 
 
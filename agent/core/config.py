@@ -3,13 +3,14 @@ Configuration management for the Terraform Agent.
 """
 
 import os
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional, Dict, Any
-from pydantic import Field, field_validator, ConfigDict
+from pydantic import Field, PrivateAttr, field_validator, ConfigDict
 from pydantic_settings import BaseSettings
-import structlog
+from .logging import get_lazy_logger
 
-logger = structlog.get_logger(__name__)
+logger = get_lazy_logger(__name__)
 
 
 class AgentConfig(BaseSettings):
@@ -39,6 +40,31 @@ class AgentConfig(BaseSettings):
         le=8192,
         description="Maximum tokens per response"
     )
+    max_concurrent_reviews: int = Field(
+        default=4,
+        ge=1,
+        description="Maximum concurrent file reviews sent to the model"
+    )
+    history_limit: int = Field(
+        default=20,
+        ge=1,
+        description="Maximum conversation exchanges retained in memory"
+    )
+    history_turn_chars: int = Field(
+        default=2000,
+        ge=100,
+        description="Characters of query/response text kept per history turn"
+    )
+    max_file_bytes: int = Field(
+        default=262144,
+        ge=1024,
+        description="Per-file content cap when embedding files in prompts"
+    )
+    max_context_bytes: int = Field(
+        default=1048576,
+        ge=4096,
+        description="Cumulative file-content budget per prompt context"
+    )
     
     # Terraform Configuration
     terraform_workspace: str = Field(
@@ -91,6 +117,16 @@ class AgentConfig(BaseSettings):
         default=300,
         description="Ollama API timeout in seconds"
     )
+    http_max_connections: int = Field(
+        default=10,
+        ge=1,
+        description="Connection pool size for the Ollama HTTP client"
+    )
+    http_keepalive_timeout: int = Field(
+        default=60,
+        ge=1,
+        description="Keep-alive timeout in seconds for pooled connections"
+    )
     
     # Security Configuration
     require_approval: bool = Field(
@@ -115,55 +151,70 @@ class AgentConfig(BaseSettings):
         default=Path("./docs"),
         description="Terraform documentation directory"
     )
-    
+
+    _dump_cache: Optional[Dict[str, Any]] = PrivateAttr(default=None)
+    _dirs_ensured: bool = PrivateAttr(default=False)
+
+    def __setattr__(self, name, value):
+        # Any field write invalidates the cached model dump
+        if not name.startswith('_'):
+            self._dump_cache = None
+            if name.endswith('_dir'):
+                self._dirs_ensured = False
+        super().__setattr__(name, value)
+
     @field_validator('git_repo_path')
     @classmethod
     def validate_git_repo_path(cls, v):
         """Validate git repository path."""
         if v is not None:
-            path = Path(v)
-            if not path.exists():
-                logger.warning(f"Git repository path does not exist: {v}")
+            # Single stat on .git, which is a directory in a normal clone
+            # but a file for worktrees and submodules; probe the path
+            # itself only to choose the right warning when it is missing
+            if not os.path.exists(os.path.join(v, ".git")):
+                if not os.path.exists(v):
+                    logger.warning(f"Git repository path does not exist: {v}")
+                else:
+                    logger.warning(f"Path is not a git repository: {v}")
                 return None
-            if not (path / ".git").exists():
-                logger.warning(f"Path is not a git repository: {v}")
-                return None
-        return v
-    
-    @field_validator('data_dir', 'logs_dir', 'docs_dir')
-    @classmethod
-    def create_directories(cls, v):
-        """Create directories if they don't exist."""
-        try:
-            v.mkdir(parents=True, exist_ok=True)
-        except (OSError, PermissionError) as e:
-            logger.warning(f"Could not create directory {v}: {e}")
-            # Use current directory as fallback
-            v = Path.cwd() / v.name
-            v.mkdir(parents=True, exist_ok=True)
         return v
     
+    def ensure_directories(self):
+        """Create data/logs/docs directories, deferred until first needed."""
+        if self._dirs_ensured:
+            return
+        for path_name in ('data_dir', 'logs_dir', 'docs_dir'):
+            path = getattr(self, path_name)
+            try:
+                path.mkdir(parents=True, exist_ok=True)
+            except (OSError, PermissionError) as e:
+                logger.warning(f"Could not create directory {path}: {e}")
+                # Use current directory as fallback
+                path = Path.cwd() / path.name
+                path.mkdir(parents=True, exist_ok=True)
+                setattr(self, path_name, path)
+        self._dirs_ensured = True
+
     def to_dict(self) -> Dict[str, Any]:
         """Convert configuration to dictionary."""
-        return self.model_dump()
+        if self._dump_cache is None:
+            self._dump_cache = self.model_dump(mode='python')
+        return self._dump_cache
     
     def update_from_env(self):
         """Update configuration from environment variables."""
-        for field_name, field in self.model_fields.items():
-            env_var = field.json_schema_extra.get('env', field_name.upper()) if field.json_schema_extra else field_name.upper()
-            if env_var in os.environ:
-                setattr(self, field_name, os.environ[env_var])
+        field_map = _env_field_map(type(self))
+        for env_var, value in os.environ.items():
+            field_name = field_map.get(env_var)
+            if field_name is not None:
+                setattr(self, field_name, value)
     
     def validate(self) -> bool:
         """Validate configuration."""
         try:
             # Validate required directories
-            for path_name in ['data_dir', 'logs_dir', 'docs_dir']:
-                path = getattr(self, path_name)
-                if not path.exists():
-                    logger.warning(f"Creating directory: {path}")
-                    path.mkdir(parents=True, exist_ok=True)
-            
+            self.ensure_directories()
+
             # Validate model name format
             if not self.agent_model or ':' not in self.agent_model:
                 raise ValueError("Model name must be in format 'model:tag'")
@@ -176,17 +227,25 @@ class AgentConfig(BaseSettings):
             return False
 
 
-# Global configuration instance
-config = AgentConfig()
+@lru_cache(maxsize=None)
+def _env_field_map(cls) -> Dict[str, str]:
+    """Map environment variable names to model field names, built once per class."""
+    mapping = {}
+    for field_name, field in cls.model_fields.items():
+        env_var = field.json_schema_extra.get('env', field_name.upper()) if field.json_schema_extra else field_name.upper()
+        mapping[env_var] = field_name
+    return mapping
+
 
+@lru_cache(maxsize=1)
 def get_config() -> AgentConfig:
-    """Get the global configuration instance."""
-    return config
+    """Get the global configuration instance, created on first use."""
+    return AgentConfig()
 
 def reload_config() -> AgentConfig:
     """Reload configuration from environment."""
-    global config
-    config = AgentConfig()
+    get_config.cache_clear()
+    config = get_config()
     config.update_from_env()
     config.validate()
     return config 
\ No newline at end of file
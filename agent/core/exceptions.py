@@ -5,111 +5,127 @@ Custom exceptions for the Terraform Agent.
 from typing import Optional, Any, Dict
 
 
+def _build_details(**kwargs: Any) -> tuple:
+    """Build a details payload from keyword arguments, dropping unset values."""
+    return tuple((key, value) for key, value in kwargs.items() if value is not None)
+
+
 class AgentError(Exception):
     """Base exception for Terraform Agent errors."""
-    
-    def __init__(self, message: str, details: Optional[Dict[str, Any]] = None):
+
+    __slots__ = ('message', '_details_items', '_formatted')
+
+    def __init__(self, message: str, details: Optional[Any] = None):
         self.message = message
-        self.details = details or {}
+        # Payload is kept as a tuple of pairs; the common no-details raise
+        # allocates no dict at all
+        if details:
+            items = details if isinstance(details, tuple) else tuple(details.items())
+            self._details_items = items
+            self._formatted = f"{message} - Details: {dict(items)}"
+        else:
+            self._details_items = ()
+            self._formatted = message
         super().__init__(self.message)
-    
+
+    @property
+    def details(self) -> Dict[str, Any]:
+        """Details as a dict, materialized on demand."""
+        return dict(self._details_items)
+
     def __str__(self):
-        if self.details:
-            return f"{self.message} - Details: {self.details}"
-        return self.message
+        return self._formatted
+
+    @classmethod
+    def expected(cls, message: str, **kwargs: Any) -> 'AgentError':
+        """Build an error for an anticipated failure.
+
+        Expected errors are used for control flow (missing paths, denied
+        approval) where the implicit exception context only adds formatting
+        cost and noise, so it is suppressed up front.
+        """
+        error = cls(message, **kwargs)
+        error.__suppress_context__ = True
+        return error
 
 
 class TerraformError(AgentError):
     """Exception raised for Terraform-related errors."""
-    
-    def __init__(self, message: str, terraform_output: Optional[str] = None, 
+
+    __slots__ = ()
+
+    def __init__(self, message: str, terraform_output: Optional[str] = None,
                  exit_code: Optional[int] = None):
-        details = {}
-        if terraform_output:
-            details['terraform_output'] = terraform_output
-        if exit_code is not None:
-            details['exit_code'] = exit_code
-        super().__init__(message, details)
+        super().__init__(message, _build_details(
+            terraform_output=terraform_output, exit_code=exit_code))
 
 
 class GitError(AgentError):
     """Exception raised for Git-related errors."""
-    
+
+    __slots__ = ()
+
     def __init__(self, message: str, git_command: Optional[str] = None,
                  git_output: Optional[str] = None):
-        details = {}
-        if git_command:
-            details['git_command'] = git_command
-        if git_output:
-            details['git_output'] = git_output
-        super().__init__(message, details)
+        super().__init__(message, _build_details(
+            git_command=git_command, git_output=git_output))
 
 
 class ModelError(AgentError):
     """Exception raised for AI model-related errors."""
-    
+
+    __slots__ = ()
+
     def __init__(self, message: str, model_name: Optional[str] = None,
                  response: Optional[str] = None):
-        details = {}
-        if model_name:
-            details['model_name'] = model_name
-        if response:
-            details['response'] = response
-        super().__init__(message, details)
+        super().__init__(message, _build_details(
+            model_name=model_name, response=response))
 
 
 class ConfigurationError(AgentError):
     """Exception raised for configuration-related errors."""
-    
+
+    __slots__ = ()
+
     def __init__(self, message: str, config_key: Optional[str] = None,
                  config_value: Optional[Any] = None):
-        details = {}
-        if config_key:
-            details['config_key'] = config_key
-        if config_value is not None:
-            details['config_value'] = config_value
-        super().__init__(message, details)
+        super().__init__(message, _build_details(
+            config_key=config_key, config_value=config_value))
 
 
 class ValidationError(AgentError):
     """Exception raised for validation errors."""
-    
+
+    __slots__ = ()
+
     def __init__(self, message: str, field: Optional[str] = None,
                  value: Optional[Any] = None):
-        details = {}
-        if field:
-            details['field'] = field
-        if value is not None:
-            details['value'] = value
-        super().__init__(message, details)
+        super().__init__(message, _build_details(field=field, value=value))
 
 
 class ApprovalError(AgentError):
     """Exception raised when user approval is denied."""
-    
-    def __init__(self, message: str = "User approval denied", 
+
+    __slots__ = ()
+
+    def __init__(self, message: str = "User approval denied",
                  action: Optional[str] = None):
-        details = {}
-        if action:
-            details['action'] = action
-        super().__init__(message, details)
+        super().__init__(message, _build_details(action=action))
 
 
 class DocumentationError(AgentError):
     """Exception raised for documentation-related errors."""
-    
+
+    __slots__ = ()
+
     def __init__(self, message: str, doc_path: Optional[str] = None):
-        details = {}
-        if doc_path:
-            details['doc_path'] = doc_path
-        super().__init__(message, details)
+        super().__init__(message, _build_details(doc_path=doc_path))
 
 
 class SecurityError(AgentError):
     """Exception raised for security-related errors."""
-    
+
+    __slots__ = ()
+
     def __init__(self, message: str, security_check: Optional[str] = None):
-        details = {}
-        if security_check:
-            details['security_check'] = security_check
-        super().__init__(message, details) 
\ No newline at end of file
+        super().__init__(message, _build_details(security_check=security_check))
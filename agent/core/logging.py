@@ -0,0 +1,71 @@
+"""
+Logging helpers for the Terraform Agent.
+"""
+
+import atexit
+import io
+import sys
+
+# Shared block-buffered log stream, created on first request
+_log_stream = None
+
+
+class _LazyLogger:
+    """Proxy that defers structlog logger creation to first use.
+
+    Attribute lookups resolve against the real logger and are cached on the
+    proxy, so only the first call pays for logger construction.
+    """
+
+    def __init__(self, name: str):
+        self._name = name
+
+    def __getattr__(self, attr):
+        import structlog
+        value = getattr(structlog.get_logger(self._name), attr)
+        self.__dict__[attr] = value
+        return value
+
+
+def get_lazy_logger(name: str) -> _LazyLogger:
+    """Return a module-level logger bound at first use instead of import time."""
+    return _LazyLogger(name)
+
+
+def json_log_renderer():
+    """Return a structlog JSON renderer backed by orjson when available."""
+    import structlog
+
+    try:
+        import orjson
+    except ImportError:
+        return structlog.processors.JSONRenderer()
+
+    def _dumps(event_dict, **kwargs):
+        return orjson.dumps(event_dict, default=str).decode()
+
+    return structlog.processors.JSONRenderer(serializer=_dumps)
+
+
+def get_buffered_log_stream():
+    """Return a block-buffered text stream over stdout for log output.
+
+    stdout is line-buffered on a tty, costing one write syscall per log
+    record. This wrapper shares stdout's underlying buffer but disables
+    line buffering so records are batched; it is flushed at interpreter
+    exit and never closes stdout.
+    """
+    global _log_stream
+    if _log_stream is None:
+        try:
+            buffer = sys.stdout.buffer
+        except AttributeError:
+            # stdout was replaced by a text-only stream (e.g. under capture)
+            return sys.stdout
+        _log_stream = io.TextIOWrapper(
+            buffer,
+            encoding=sys.stdout.encoding or 'utf-8',
+            line_buffering=False
+        )
+        atexit.register(_log_stream.flush)
+    return _log_stream
@@ -3,17 +3,35 @@ Git repository integration for the Terraform Agent.
 """
 
 import os
+from functools import cached_property
 from pathlib import Path
 from typing import Dict, List, Optional, Any
 import git
-import structlog
 from ..core.exceptions import GitError
+from ..core.logging import get_lazy_logger
 
-logger = structlog.get_logger(__name__)
+logger = get_lazy_logger(__name__)
 
 # Global repository instance
 _repository: Optional['GitRepository'] = None
 
+# File extensions treated as Terraform configuration
+TERRAFORM_EXTENSIONS = frozenset({'.tf', '.tfvars', '.hcl'})
+
+# Shared git.Repo handles and discovered roots, keyed by path, so repeat
+# initialization reuses the handle and skips the parent-directory walk
+_repo_handles: Dict[str, git.Repo] = {}
+_discovered_roots: Dict[str, str] = {}
+
+
+def _open_repo(path: str) -> git.Repo:
+    """Open a git.Repo for path, reusing a previously opened handle."""
+    repo = _repo_handles.get(path)
+    if repo is None:
+        repo = git.Repo(path)
+        _repo_handles[path] = repo
+    return repo
+
 
 class GitRepository:
     """Git repository wrapper for Terraform Agent."""
@@ -21,27 +39,36 @@ class GitRepository:
     def __init__(self, repo_path: Optional[str] = None):
         self.repo_path = Path(repo_path) if repo_path else None
         self.repo: Optional[git.Repo] = None
+        self._tf_cache: Optional[tuple] = None
+        self._info_cache: Optional[tuple] = None
         self._initialize_repository()
     
     def _initialize_repository(self):
         """Initialize git repository."""
         try:
             if self.repo_path:
-                if not self.repo_path.exists():
-                    raise GitError(f"Repository path does not exist: {self.repo_path}")
-                
-                if not (self.repo_path / ".git").exists():
+                # One stat on .git covers the common case; only on failure do
+                # we probe the path itself to pick the right diagnostic
+                if not os.path.exists(os.path.join(self._repo_path_str, ".git")):
+                    if not os.path.exists(self._repo_path_str):
+                        raise GitError.expected(f"Repository path does not exist: {self.repo_path}")
                     logger.warning(f"Path is not a git repository: {self.repo_path}")
                     return
-                
-                self.repo = git.Repo(self.repo_path)
+
+                self.repo = _open_repo(self._repo_path_str)
                 logger.info(f"Initialized git repository: {self.repo_path}")
             else:
                 # Try to find git repository in current directory
-                current_path = Path.cwd()
+                current_path = str(Path.cwd())
                 try:
-                    self.repo = git.Repo(current_path, search_parent_directories=True)
-                    self.repo_path = Path(self.repo.working_dir)
+                    root = _discovered_roots.get(current_path)
+                    if root is None:
+                        repo = git.Repo(current_path, search_parent_directories=True)
+                        root = repo.working_dir
+                        _discovered_roots[current_path] = root
+                        _repo_handles.setdefault(root, repo)
+                    self.repo = _open_repo(root)
+                    self.repo_path = Path(root)
                     logger.info(f"Found git repository: {self.repo_path}")
                 except git.InvalidGitRepositoryError:
                     logger.warning("No git repository found in current directory")
@@ -50,52 +77,168 @@ class GitRepository:
             logger.error(f"Failed to initialize git repository: {e}")
             raise GitError(f"Git initialization failed: {e}")
     
+    def _status_summary(self) -> tuple:
+        """Collect staged, modified and untracked paths from one git status call."""
+        output = self.repo.git.status('--porcelain=v2', '-z')
+        staged = []
+        modified = []
+        untracked = []
+        records = output.split('\0')
+        index = 0
+        while index < len(records):
+            record = records[index]
+            index += 1
+            if not record:
+                continue
+            kind = record[0]
+            if kind == '?':
+                untracked.append(record[2:])
+            elif kind == '1':
+                fields = record.split(' ', 8)
+                xy, path = fields[1], fields[8]
+                if xy[0] != '.':
+                    staged.append(path)
+                if xy[1] != '.':
+                    modified.append(path)
+            elif kind == '2':
+                fields = record.split(' ', 9)
+                xy, path = fields[1], fields[9]
+                # Rename records carry the original path in the next field
+                index += 1
+                if xy[0] != '.':
+                    staged.append(path)
+                if xy[1] != '.':
+                    modified.append(path)
+            elif kind == 'u':
+                modified.append(record.split(' ', 10)[10])
+        return staged, modified, untracked
+
     def get_repository_info(self) -> Dict[str, Any]:
         """Get repository information."""
         if not self.repo:
             return {"error": "No git repository available"}
-        
+
         try:
-            return {
+            head_commit = self.repo.head.commit
+            staged, modified, untracked = self._status_summary()
+            is_dirty = bool(staged or modified or untracked)
+
+            # Serve the cached snapshot while HEAD is unchanged and the
+            # working tree stays clean; a dirty tree always rebuilds
+            if (not is_dirty and self._info_cache is not None
+                    and self._info_cache[0] == head_commit.hexsha):
+                return self._info_cache[1]
+
+            info = {
                 "path": str(self.repo_path),
                 "branch": self.repo.active_branch.name,
-                "commit": self.repo.head.commit.hexsha,
-                "commit_message": self.repo.head.commit.message.strip(),
-                "author": self.repo.head.commit.author.name,
+                "commit": head_commit.hexsha,
+                "commit_message": head_commit.message.strip(),
+                "author": head_commit.author.name,
                 "remote_urls": [remote.url for remote in self.repo.remotes],
-                "is_dirty": self.repo.is_dirty(),
-                "untracked_files": self.repo.untracked_files,
-                "modified_files": [item.a_path for item in self.repo.index.diff(None)],
-                "staged_files": [item.a_path for item in self.repo.index.diff('HEAD')]
+                "is_dirty": bool(staged or modified),
+                "untracked_files": untracked,
+                "modified_files": modified,
+                "staged_files": staged
             }
+            if not is_dirty:
+                self._info_cache = (head_commit.hexsha, info)
+            return info
         except Exception as e:
             logger.error(f"Failed to get repository info: {e}")
             return {"error": str(e)}
     
+    @cached_property
+    def _repo_path_str(self) -> str:
+        """String form of repo_path, computed once per instance."""
+        return str(self.repo_path)
+
+    @cached_property
+    def _repo_prefix_len(self) -> int:
+        """Length of the repo root prefix used to relativize paths."""
+        return len(self._repo_path_str.rstrip(os.sep)) + 1
+
+    def _terraform_files_cache_key(self) -> tuple:
+        """Build the invalidation key for the Terraform file cache."""
+        try:
+            mtime_ns = self.repo_path.stat().st_mtime_ns
+        except OSError:
+            mtime_ns = 0
+        head_sha = ""
+        if self.repo is not None:
+            try:
+                head_sha = self.repo.head.commit.hexsha
+            except Exception:
+                head_sha = ""
+        return (mtime_ns, head_sha)
+
+    def invalidate_terraform_files(self):
+        """Invalidate the cached Terraform file listing after writes."""
+        self._tf_cache = None
+
     def find_terraform_files(self) -> List[Dict[str, Any]]:
         """Find all Terraform files in the repository."""
         if not self.repo_path:
             return []
-        
+
+        # Return the memoized listing if the repo root and HEAD are unchanged
+        cache_key = self._terraform_files_cache_key()
+        if self._tf_cache is not None and self._tf_cache[0] == cache_key:
+            return self._tf_cache[1]
+
         terraform_files = []
-        terraform_extensions = {'.tf', '.tfvars', '.hcl'}
-        
+
         try:
-            for file_path in self.repo_path.rglob('*'):
-                if file_path.is_file() and file_path.suffix in terraform_extensions:
-                    # Skip .git directory
-                    if '.git' in file_path.parts:
+            if self.repo is not None:
+                # Let git enumerate tracked and untracked Terraform files
+                # instead of walking the working tree ourselves
+                output = self.repo.git.ls_files(
+                    '--cached', '--others', '--exclude-standard',
+                    '*.tf', '*.tfvars', '*.hcl'
+                )
+                for rel_path in output.splitlines():
+                    if not rel_path:
+                        continue
+                    absolute_path = os.path.join(self._repo_path_str, rel_path)
+                    try:
+                        stat_result = os.stat(absolute_path)
+                    except OSError:
                         continue
-                    
                     terraform_files.append({
-                        "path": str(file_path.relative_to(self.repo_path)),
-                        "absolute_path": str(file_path),
-                        "size": file_path.stat().st_size,
-                        "extension": file_path.suffix,
-                        "modified": file_path.stat().st_mtime
+                        "path": rel_path,
+                        "absolute_path": absolute_path,
+                        "size": stat_result.st_size,
+                        "extension": '.' + rel_path.rpartition('.')[2],
+                        "modified": stat_result.st_mtime
                     })
-            
+                logger.info(f"Found {len(terraform_files)} Terraform files")
+                self._tf_cache = (cache_key, terraform_files)
+                return terraform_files
+
+            # Explicit scandir-based DFS: one stat per entry, prunes .git up front
+            prefix_len = self._repo_prefix_len
+            stack = [self._repo_path_str]
+            while stack:
+                current = stack.pop()
+                with os.scandir(current) as entries:
+                    for entry in entries:
+                        if entry.is_dir(follow_symlinks=False):
+                            if entry.name != '.git':
+                                stack.append(entry.path)
+                            continue
+                        extension = '.' + entry.name.rpartition('.')[2]
+                        if extension in TERRAFORM_EXTENSIONS and entry.is_file(follow_symlinks=False):
+                            stat_result = entry.stat()
+                            terraform_files.append({
+                                "path": entry.path[prefix_len:],
+                                "absolute_path": entry.path,
+                                "size": stat_result.st_size,
+                                "extension": extension,
+                                "modified": stat_result.st_mtime
+                            })
+
             logger.info(f"Found {len(terraform_files)} Terraform files")
+            self._tf_cache = (cache_key, terraform_files)
             return terraform_files
             
         except Exception as e:
@@ -107,16 +250,31 @@ class GitRepository:
         if not self.repo_path:
             return None
         
+        full_path = os.path.join(self._repo_path_str, file_path)
         try:
-            full_path = self.repo_path / file_path
-            if full_path.exists():
-                return full_path.read_text(encoding='utf-8')
-            else:
-                logger.warning(f"File not found: {file_path}")
-                return None
+            # Read in fixed 128KB chunks via raw descriptors; skips the
+            # extra exists() stat and TextIOWrapper layering of read_text
+            fd = os.open(full_path, os.O_RDONLY)
+        except FileNotFoundError:
+            logger.warning(f"File not found: {file_path}")
+            return None
+        except OSError as e:
+            logger.error(f"Failed to read file {file_path}: {e}")
+            return None
+
+        try:
+            chunks = []
+            while True:
+                chunk = os.read(fd, 131072)
+                if not chunk:
+                    break
+                chunks.append(chunk)
+            return b"".join(chunks).decode('utf-8')
         except Exception as e:
             logger.error(f"Failed to read file {file_path}: {e}")
             return None
+        finally:
+            os.close(fd)
     
     def get_recent_commits(self, limit: int = 10) -> List[Dict[str, Any]]:
         """Get recent commits."""
@@ -124,14 +282,24 @@ class GitRepository:
             return []
         
         try:
+            # One `git log --name-only` call instead of a diff per commit
+            output = self.repo.git.log(
+                'HEAD',
+                '--name-only',
+                f'--max-count={limit}',
+                '--pretty=format:\x1e%H%x00%an%x00%cI%x00%B%x00'
+            )
             commits = []
-            for commit in self.repo.iter_commits('HEAD', max_count=limit):
+            for record in output.split('\x1e'):
+                if not record:
+                    continue
+                sha, author, date, message, files_blob = record.split('\x00', 4)
                 commits.append({
-                    "hash": commit.hexsha,
-                    "message": commit.message.strip(),
-                    "author": commit.author.name,
-                    "date": commit.committed_datetime.isoformat(),
-                    "files": list(commit.stats.files.keys())
+                    "hash": sha,
+                    "message": message.strip(),
+                    "author": author,
+                    "date": date,
+                    "files": [line for line in files_blob.splitlines() if line]
                 })
             return commits
         except Exception as e:
@@ -144,13 +312,24 @@ class GitRepository:
             return []
         
         try:
+            # Author and date come from one formatted git log run instead of
+            # lazy per-commit object reads
+            output = self.repo.git.log(
+                'HEAD',
+                f'--max-count={limit}',
+                '--pretty=format:\x1e%H%x00%an%x00%cI%x00%B',
+                '--', file_path
+            )
             commits = []
-            for commit in self.repo.iter_commits('HEAD', paths=file_path, max_count=limit):
+            for record in output.split('\x1e'):
+                if not record:
+                    continue
+                sha, author, date, message = record.split('\x00', 3)
                 commits.append({
-                    "hash": commit.hexsha,
-                    "message": commit.message.strip(),
-                    "author": commit.author.name,
-                    "date": commit.committed_datetime.isoformat()
+                    "hash": sha,
+                    "message": message.strip(),
+                    "author": author,
+                    "date": date
                 })
             return commits
         except Exception as e:
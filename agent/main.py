@@ -5,23 +5,25 @@ Main entry point for the Terraform Agent.
 import asyncio
 import sys
 import argparse
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
-import structlog
-from rich.console import Console
-from rich.panel import Panel
-from rich.text import Text
-from rich.table import Table
 
-from .core.agent import get_agent, close_agent
-from .core.config import get_config, reload_config
+from .core.logging import get_lazy_logger
 
-console = Console()
-logger = structlog.get_logger(__name__)
+logger = get_lazy_logger(__name__)
 
 
-async def main():
-    """Main entry point."""
+@lru_cache(maxsize=1)
+def get_console():
+    """Create the shared Rich console on first use."""
+    from rich.console import Console
+    return Console()
+
+
+@lru_cache(maxsize=1)
+def build_parser() -> argparse.ArgumentParser:
+    """Build the command line argument parser, constructed once per process."""
     parser = argparse.ArgumentParser(
         description="X-Terraform Agent v0.0.1 - AI-powered Terraform assistant with offline capabilities",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -107,9 +109,26 @@ Examples:
         type=str,
         help="Path to configuration file"
     )
-    
-    args = parser.parse_args()
-    
+
+    parser.add_argument(
+        "--version",
+        action="version",
+        version="X-Terraform Agent v0.0.1"
+    )
+
+    return parser
+
+
+async def main():
+    """Main entry point."""
+    # --help and --version exit inside parse_args, before the console,
+    # configuration or agent stack is touched
+    args = build_parser().parse_args()
+    console = get_console()
+
+    from .core.agent import get_agent, close_agent
+    from .core.config import get_config
+
     try:
         # Setup logging
         setup_logging(args.verbose)
@@ -125,7 +144,13 @@ Examples:
         
         # Show banner
         show_banner()
-        
+
+        if args.status:
+            # Status reporting must stay cheap: answer from process state
+            # without constructing the agent or touching Ollama
+            await handle_status(None)
+            return
+
         # Get agent instance
         agent = await get_agent()
         
@@ -151,8 +176,6 @@ Examples:
             await handle_review(agent)
         elif args.validate:
             await handle_validate(agent)
-        elif args.status:
-            await handle_status(agent)
         elif args.query:
             await handle_query(agent, args.query, not args.no_approval)
         else:
@@ -173,7 +196,11 @@ Examples:
 def setup_logging(verbose: bool):
     """Setup logging configuration."""
     import logging
-    
+
+    import structlog
+
+    from .core.logging import get_buffered_log_stream, json_log_renderer
+
     log_level = logging.DEBUG if verbose else logging.INFO
     
     structlog.configure(
@@ -186,7 +213,7 @@ def setup_logging(verbose: bool):
             structlog.processors.StackInfoRenderer(),
             structlog.processors.format_exc_info,
             structlog.processors.UnicodeDecoder(),
-            structlog.processors.JSONRenderer()
+            json_log_renderer()
         ],
         context_class=dict,
         logger_factory=structlog.stdlib.LoggerFactory(),
@@ -196,24 +223,31 @@ def setup_logging(verbose: bool):
     
     logging.basicConfig(
         format="%(message)s",
-        stream=sys.stdout,
+        stream=get_buffered_log_stream(),
         level=log_level,
     )
 
 
 def load_configuration(config_path: str):
     """Load configuration from file."""
+    console = get_console()
     try:
         config_file = Path(config_path)
         if not config_file.exists():
             console.print(f"[red]Configuration file not found: {config_path}[/red]")
             return
         
-        # Load environment variables from file
-        from dotenv import load_dotenv
+        # Load environment variables from file; dotenv stays a function-local
+        # import so runs without --config never pay for it
+        try:
+            from dotenv import load_dotenv
+        except ImportError:
+            console.print("[red]python-dotenv is required for --config file loading[/red]")
+            return
         load_dotenv(config_file)
-        
+
         # Reload configuration
+        from .core.config import reload_config
         reload_config()
         
         console.print(f"[green]Configuration loaded from: {config_path}[/green]")
@@ -224,62 +258,55 @@ def load_configuration(config_path: str):
 
 def show_banner():
     """Show application banner."""
-    # Create an attractive banner with project information
-    banner_text = Text()
-    banner_text.append("🚀 ", style="bold blue")
-    banner_text.append("X-Terraform Agent v0.0.1", style="bold blue")
-    banner_text.append("\n\n", style="white")
-    banner_text.append("✨ ", style="bold yellow")
-    banner_text.append("Terraform Agent offered by ", style="white")
-    banner_text.append("https://anzx.ai/", style="bold cyan")
-    banner_text.append("\n", style="white")
-    banner_text.append("🌟 ", style="bold yellow")
-    banner_text.append("Personal project of ", style="white")
-    banner_text.append("Inder Chauhan", style="bold green")
-    banner_text.append(" (not affiliated with any bank)", style="white")
-    banner_text.append("\n", style="white")
-    banner_text.append("🤖 ", style="bold yellow")
-    banner_text.append("Part of the ", style="white")
-    banner_text.append("X-agents Team", style="bold magenta")
-    banner_text.append(" - Always learning, always evolving!", style="white")
-    banner_text.append("\n\n", style="white")
-    banner_text.append("🙏 ", style="bold yellow")
-    banner_text.append("Thanks to its Developer ", style="white")
-    banner_text.append("Inder Chauhan", style="bold green")
-    banner_text.append(" for this amazing tool!", style="white")
-    banner_text.append("\n\n", style="white")
-    banner_text.append("💻 ", style="bold yellow")
-    banner_text.append("Do contribute to this project on ", style="white")
-    banner_text.append("https://github.com/inderanz/x-terraform", style="bold cyan")
-    banner_text.append("\n", style="white")
-    banner_text.append("🎉 ", style="bold yellow")
-    banner_text.append("Happy Terraforming!", style="bold green")
-    
-    banner = Panel(
-        banner_text,
+    from rich.panel import Panel
+
+    console = get_console()
+    # One pre-rendered markup string instead of twenty Text.append calls
+    banner_markup = (
+        "[bold blue]🚀 X-Terraform Agent v0.0.1[/bold blue]\n\n"
+        "[bold yellow]✨ [/bold yellow]Terraform Agent offered by [bold cyan]https://anzx.ai/[/bold cyan]\n"
+        "[bold yellow]🌟 [/bold yellow]Personal project of [bold green]Inder Chauhan[/bold green] (not affiliated with any bank)\n"
+        "[bold yellow]🤖 [/bold yellow]Part of the [bold magenta]X-agents Team[/bold magenta] - Always learning, always evolving!\n\n"
+        "[bold yellow]🙏 [/bold yellow]Thanks to its Developer [bold green]Inder Chauhan[/bold green] for this amazing tool!\n\n"
+        "[bold yellow]💻 [/bold yellow]Do contribute to this project on [bold cyan]https://github.com/inderanz/x-terraform[/bold cyan]\n"
+        "[bold yellow]🎉 [/bold yellow][bold green]Happy Terraforming![/bold green]"
+    )
+
+    console.print(Panel(
+        banner_markup,
         subtitle="AI-powered Terraform assistant with offline capabilities",
         border_style="blue",
         padding=(1, 2)
-    )
-    console.print(banner)
-    
+    ))
+
     # Show capabilities
-    capabilities_table = Table(title="Capabilities", show_header=True, header_style="bold magenta")
-    capabilities_table.add_column("Feature", style="cyan")
-    capabilities_table.add_column("Description", style="white")
-    
-    capabilities_table.add_row("Local File Processing", "Works with local Terraform files (no git required)")
-    capabilities_table.add_row("Code Review", "AI-powered code review and suggestions")
-    capabilities_table.add_row("Best Practices", "Latest Terraform best practices from HashiCorp")
-    capabilities_table.add_row("Offline Mode", "Fully functional without internet connection")
-    capabilities_table.add_row("Documentation", "References latest Terraform docs (as of 2024-06-22)")
-    capabilities_table.add_row("Code Generation", "Generate production-ready Terraform configurations")
-    
-    console.print(capabilities_table)
+    print_rows("Capabilities", [
+        ("Local File Processing", "Works with local Terraform files (no git required)"),
+        ("Code Review", "AI-powered code review and suggestions"),
+        ("Best Practices", "Latest Terraform best practices from HashiCorp"),
+        ("Offline Mode", "Fully functional without internet connection"),
+        ("Documentation", "References latest Terraform docs (as of 2024-06-22)"),
+        ("Code Generation", "Generate production-ready Terraform configurations")
+    ], console)
+
+
+def print_rows(title: str, rows, console=None):
+    """Print labelled rows with a single console call.
+
+    A lightweight replacement for rich.Table in hot display paths: keeps the
+    markup styling but skips column measurement and table layout.
+    """
+    console = console or get_console()
+    lines = [f"[bold magenta]{title}[/bold magenta]"]
+    for row in rows:
+        label, rest = row[0], "  ".join(str(cell) for cell in row[1:])
+        lines.append(f"  [cyan]{label}[/cyan]  {rest}")
+    console.print("\n".join(lines))
 
 
 async def handle_analyze(agent):
     """Handle analyze command."""
+    console = get_console()
     console.print("\n[bold blue]Analyzing Terraform files...[/bold blue]")
     
     if not agent.current_directory:
@@ -291,20 +318,18 @@ async def handle_analyze(agent):
         
         # Display analysis results
         console.print("\n[bold green]Analysis Results:[/bold green]")
-        
-        analysis_table = Table(title="Terraform Analysis", show_header=True, header_style="bold magenta")
-        analysis_table.add_column("Metric", style="cyan")
-        analysis_table.add_column("Value", style="white")
-        
+
+        rows = []
         if "summary" in analysis:
             summary = analysis["summary"]
-            analysis_table.add_row("Total Files", str(summary.get("total_files", 0)))
-            analysis_table.add_row("Providers", ", ".join(summary.get("providers", [])))
-            analysis_table.add_row("Resources", ", ".join(summary.get("resources", [])))
-            analysis_table.add_row("Variables", ", ".join(summary.get("variables", [])))
-            analysis_table.add_row("Outputs", ", ".join(summary.get("outputs", [])))
-        
-        console.print(analysis_table)
+            rows = [
+                ("Total Files", str(summary.get("total_files", 0))),
+                ("Providers", ", ".join(summary.get("providers", []))),
+                ("Resources", ", ".join(summary.get("resources", []))),
+                ("Variables", ", ".join(summary.get("variables", []))),
+                ("Outputs", ", ".join(summary.get("outputs", [])))
+            ]
+        print_rows("Terraform Analysis", rows, console)
         
     except Exception as e:
         console.print(f"[red]Analysis failed: {e}[/red]")
@@ -312,6 +337,7 @@ async def handle_analyze(agent):
 
 async def handle_review(agent):
     """Handle review command."""
+    console = get_console()
     console.print("\n[bold blue]Reviewing Terraform code...[/bold blue]")
     
     if not agent.current_directory:
@@ -351,6 +377,9 @@ async def handle_review(agent):
 
 async def handle_validate(agent):
     """Handle validate command."""
+    from rich.table import Table
+
+    console = get_console()
     console.print("\n[bold blue]Validating Terraform files...[/bold blue]")
     
     if not agent.current_directory:
@@ -358,8 +387,10 @@ async def handle_validate(agent):
         return
     
     try:
+        from .terraform.parser import iter_terraform_paths
+
         directory = Path(agent.current_directory)
-        terraform_files = list(directory.rglob("*.tf"))
+        terraform_files = list(iter_terraform_paths(directory))
         
         if not terraform_files:
             console.print("[yellow]No Terraform files found in the directory.[/yellow]")
@@ -369,31 +400,30 @@ async def handle_validate(agent):
         validation_table.add_column("File", style="cyan")
         validation_table.add_column("Status", style="white")
         validation_table.add_column("Issues", style="white")
-        
-        for file_path in terraform_files:
+
+        async def validate_one(file_path):
             try:
-                validation = agent.analyzer.validate_configuration(str(file_path))
-                
+                validation = await asyncio.to_thread(
+                    agent.analyzer.validate_configuration, str(file_path)
+                )
+
                 if validation.get("errors"):
                     status = "[red]❌ Invalid[/red]"
                     issues = ", ".join(validation["errors"])
                 else:
                     status = "[green]✅ Valid[/green]"
                     issues = "None"
-                
-                validation_table.add_row(
-                    str(file_path.relative_to(directory)),
-                    status,
-                    issues
-                )
-                
+
+                return (str(file_path.relative_to(directory)), status, issues)
+
             except Exception as e:
-                validation_table.add_row(
-                    str(file_path.relative_to(directory)),
-                    "[red]❌ Error[/red]",
-                    str(e)
-                )
-        
+                return (str(file_path.relative_to(directory)), "[red]❌ Error[/red]", str(e))
+
+        # Validate files concurrently; row order matches the file list
+        rows = await asyncio.gather(*(validate_one(fp) for fp in terraform_files))
+        for row in rows:
+            validation_table.add_row(*row)
+
         console.print(validation_table)
         
     except Exception as e:
@@ -401,42 +431,44 @@ async def handle_validate(agent):
 
 
 async def handle_status(agent):
-    """Handle status command."""
+    """Handle status command.
+
+    Accepts agent=None for the fast path where no agent has been
+    constructed yet.
+    """
+    console = get_console()
     console.print("\n[bold blue]Agent Status:[/bold blue]")
-    
-    status_table = Table(title="X-Terraform Agent Status", show_header=True, header_style="bold magenta")
-    status_table.add_column("Component", style="cyan")
-    status_table.add_column("Status", style="white")
-    status_table.add_column("Details", style="white")
-    
-    # Agent status
-    status_table.add_row("Agent", "[green]✅ Running[/green]", "X-Terraform Agent v0.0.1")
-    
+
+    if agent is None:
+        rows = [("Agent", "[yellow]⚠️ Not initialized[/yellow]", "Starts on first query")]
+    else:
+        rows = [("Agent", "[green]✅ Running[/green]", "X-Terraform Agent v0.0.1")]
+
     # Ollama status
     try:
-        if agent.ollama_client:
-            status_table.add_row("Ollama", "[green]✅ Connected[/green]", "Model available")
+        if agent is not None and agent.ollama_client:
+            rows.append(("Ollama", "[green]✅ Connected[/green]", "Model available"))
         else:
-            status_table.add_row("Ollama", "[red]❌ Not connected[/red]", "No connection")
+            rows.append(("Ollama", "[red]❌ Not connected[/red]", "No connection"))
     except:
-        status_table.add_row("Ollama", "[red]❌ Error[/red]", "Connection failed")
-    
+        rows.append(("Ollama", "[red]❌ Error[/red]", "Connection failed"))
+
     # Working directory
-    if agent.current_directory:
-        status_table.add_row("Working Directory", "[green]✅ Set[/green]", agent.current_directory)
+    if agent is not None and agent.current_directory:
+        rows.append(("Working Directory", "[green]✅ Set[/green]", agent.current_directory))
     else:
-        status_table.add_row("Working Directory", "[yellow]⚠️ Not set[/yellow]", "Use --dir to specify")
-    
+        rows.append(("Working Directory", "[yellow]⚠️ Not set[/yellow]", "Use --dir to specify"))
+
     # Git repository
-    if agent.repository:
-        status_table.add_row("Git Repository", "[green]✅ Available[/green]", "Git integration enabled")
+    if agent is not None and agent.repository:
+        rows.append(("Git Repository", "[green]✅ Available[/green]", "Git integration enabled"))
     else:
-        status_table.add_row("Git Repository", "[yellow]⚠️ Not available[/yellow]", "Optional - not required")
-    
+        rows.append(("Git Repository", "[yellow]⚠️ Not available[/yellow]", "Optional - not required"))
+
     # Terraform documentation
-    status_table.add_row("Documentation", "[green]✅ Current[/green]", "Latest as of 2024-06-22")
-    
-    console.print(status_table)
+    rows.append(("Documentation", "[green]✅ Current[/green]", "Latest as of 2024-06-22"))
+
+    print_rows("X-Terraform Agent Status", rows, console)
     
     # Show capabilities
     console.print(f"\n[bold green]Capabilities:[/bold green]")
@@ -450,6 +482,7 @@ async def handle_status(agent):
 
 async def handle_query(agent, query: str, require_approval: bool):
     """Handle query command."""
+    console = get_console()
     console.print(f"\n[bold blue]Processing query: {query}[/bold blue]")
     
     try:
@@ -473,5 +506,15 @@ async def handle_query(agent, query: str, require_approval: bool):
         console.print(f"[red]Query failed: {e}[/red]")
 
 
+def run():
+    """Synchronous entry point that runs the event loop on uvloop when available."""
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass
+    asyncio.run(main())
+
+
 if __name__ == "__main__":
-    asyncio.run(main()) 
\ No newline at end of file
+    run()
\ No newline at end of file
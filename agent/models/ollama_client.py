@@ -11,18 +11,80 @@ import structlog
 from ..core.config import get_config
 from ..core.exceptions import ModelError
 
+try:
+    import orjson
+    _json_loads = orjson.loads
+    _json_dumps = orjson.dumps
+except ImportError:
+    # stdlib json also accepts bytes input
+    _json_loads = json.loads
+
+    def _json_dumps(obj):
+        return json.dumps(obj).encode()
+
 logger = structlog.get_logger(__name__)
 
+# Available-model names survive disconnect/reconnect cycles here and are
+# refreshed once the TTL expires
+_MODELS_TTL = 300.0
+_models_cache: Optional[tuple] = None  # (fetched_at, frozenset of names)
+
+
+async def _iter_json_lines(content):
+    """Yield parsed JSON objects from a streaming newline-delimited body.
+
+    Reads whatever bytes are available with iter_any() and splits records
+    out of a single bytearray accumulator, avoiding the per-line readline
+    scans of iterating the stream directly.
+    """
+    buffer = bytearray()
+    async for chunk in content.iter_any():
+        buffer.extend(chunk)
+        while True:
+            newline = buffer.find(b'\n')
+            if newline < 0:
+                break
+            line = bytes(buffer[:newline])
+            del buffer[:newline + 1]
+            if line:
+                try:
+                    yield _json_loads(line)
+                except ValueError:
+                    continue
+    if buffer:
+        try:
+            yield _json_loads(bytes(buffer))
+        except ValueError:
+            pass
+
 
 class OllamaClient:
     """Client for interacting with Ollama API."""
-    
+
+    __slots__ = ('config', 'host', 'timeout', 'session', '_available_models',
+                 '_pool_limit', '_keepalive_timeout')
+
     def __init__(self, host: Optional[str] = None, timeout: Optional[int] = None):
-        self.config = get_config()
-        self.host = host or self.config.ollama_host
-        self.timeout = timeout or self.config.ollama_timeout
+        # Snapshot the config once; hot methods read locals, not the model
+        config = get_config()
+        self.config = config
+        self.host = host or config.ollama_host
+        self.timeout = timeout or config.ollama_timeout
         self.session: Optional[aiohttp.ClientSession] = None
-        self._available_models: Optional[List[str]] = None
+        self._available_models: Optional[frozenset] = None
+        self._pool_limit = config.http_max_connections
+        self._keepalive_timeout = config.http_keepalive_timeout
+
+    def configure_pool(self, max_connections: int, keepalive_timeout: Optional[int] = None):
+        """Tune the connection pool; applies when the session is (re)created.
+
+        Size max_connections to the server's parallel request capacity:
+        a single-model Ollama instance queues past 4-8 concurrent calls,
+        so a larger pool only parks sockets.
+        """
+        self._pool_limit = max_connections
+        if keepalive_timeout is not None:
+            self._keepalive_timeout = keepalive_timeout
     
     async def __aenter__(self):
         """Async context manager entry."""
@@ -37,9 +99,16 @@ class OllamaClient:
         """Establish connection to Ollama."""
         if self.session is None:
             timeout = aiohttp.ClientTimeout(total=self.timeout)
+            # One pooled session per client lifetime; keep-alive avoids a TCP
+            # handshake per request against the local Ollama server
+            connector = aiohttp.TCPConnector(
+                limit=self._pool_limit,
+                keepalive_timeout=self._keepalive_timeout
+            )
             self.session = aiohttp.ClientSession(
                 base_url=self.host,
                 timeout=timeout,
+                connector=connector,
                 headers={"Content-Type": "application/json"}
             )
             logger.info(f"Connected to Ollama at {self.host}")
@@ -71,7 +140,10 @@ class OllamaClient:
                 
                 data = await response.json()
                 models = data.get("models", [])
-                self._available_models = [model["name"] for model in models]
+                names = frozenset(model["name"] for model in models)
+                self._available_models = names
+                global _models_cache
+                _models_cache = (time.time(), names)
                 logger.info(f"Found {len(models)} available models")
                 return models
         except Exception as e:
@@ -80,9 +152,9 @@ class OllamaClient:
     
     async def is_model_available(self, model_name: str) -> bool:
         """Check if a specific model is available."""
-        if self._available_models is None:
+        if _models_cache is None or time.time() - _models_cache[0] >= _MODELS_TTL:
             await self.list_models()
-        return model_name in (self._available_models or [])
+        return model_name in (_models_cache[1] if _models_cache else frozenset())
     
     async def pull_model(self, model_name: str) -> bool:
         """Pull a model from Ollama registry."""
@@ -90,19 +162,14 @@ class OllamaClient:
             await self.connect()
             logger.info(f"Pulling model: {model_name}")
             
-            async with self.session.post("/api/pull", json={"name": model_name}) as response:
+            async with self.session.post("/api/pull", data=_json_dumps({"name": model_name})) as response:
                 if response.status != 200:
                     raise ModelError(f"Failed to pull model: {response.status}")
                 
                 # Stream the response to show progress
-                async for line in response.content:
-                    if line:
-                        try:
-                            data = json.loads(line.decode().strip())
-                            if "status" in data:
-                                logger.info(f"Model pull status: {data['status']}")
-                        except json.JSONDecodeError:
-                            continue
+                async for data in _iter_json_lines(response.content):
+                    if "status" in data:
+                        logger.info(f"Model pull status: {data['status']}")
                 
                 logger.info(f"Successfully pulled model: {model_name}")
                 return True
@@ -110,6 +177,33 @@ class OllamaClient:
             logger.error(f"Failed to pull model {model_name}: {e}")
             raise ModelError(f"Failed to pull model {model_name}: {e}")
     
+    async def _prepare_request(
+        self,
+        model_name: Optional[str],
+        temperature: Optional[float],
+        max_tokens: Optional[int],
+        **kwargs
+    ) -> tuple:
+        """Shared preamble for generate/chat: connect, resolve defaults, ensure model."""
+        await self.connect()
+
+        config = self.config
+        model_name = model_name or config.agent_model
+        temperature = temperature or config.temperature
+        max_tokens = max_tokens or config.max_tokens
+
+        # Check if model is available
+        if not await self.is_model_available(model_name):
+            logger.info(f"Model {model_name} not available, pulling...")
+            await self.pull_model(model_name)
+
+        options = {
+            "temperature": temperature,
+            "num_predict": max_tokens,
+            **kwargs
+        }
+        return model_name, options
+
     async def generate(
         self,
         prompt: str,
@@ -121,35 +215,24 @@ class OllamaClient:
     ) -> str:
         """Generate a response from the model."""
         try:
-            await self.connect()
-            
-            model_name = model_name or self.config.agent_model
-            temperature = temperature or self.config.temperature
-            max_tokens = max_tokens or self.config.max_tokens
-            
-            # Check if model is available
-            if not await self.is_model_available(model_name):
-                logger.info(f"Model {model_name} not available, pulling...")
-                await self.pull_model(model_name)
-            
+            model_name, options = await self._prepare_request(
+                model_name, temperature, max_tokens, **kwargs
+            )
+
             payload = {
                 "model": model_name,
                 "prompt": prompt,
                 "stream": False,
-                "options": {
-                    "temperature": temperature,
-                    "num_predict": max_tokens,
-                    **kwargs
-                }
+                "options": options
             }
-            
+
             if system_prompt:
                 payload["system"] = system_prompt
             
             logger.debug(f"Generating response with model: {model_name}")
             start_time = time.time()
             
-            async with self.session.post("/api/generate", json=payload) as response:
+            async with self.session.post("/api/generate", data=_json_dumps(payload)) as response:
                 if response.status != 200:
                     raise ModelError(f"Generation failed: {response.status}")
                 
@@ -176,45 +259,29 @@ class OllamaClient:
     ) -> AsyncGenerator[str, None]:
         """Generate a streaming response from the model."""
         try:
-            await self.connect()
-            
-            model_name = model_name or self.config.agent_model
-            temperature = temperature or self.config.temperature
-            max_tokens = max_tokens or self.config.max_tokens
-            
-            # Check if model is available
-            if not await self.is_model_available(model_name):
-                logger.info(f"Model {model_name} not available, pulling...")
-                await self.pull_model(model_name)
-            
+            model_name, options = await self._prepare_request(
+                model_name, temperature, max_tokens, **kwargs
+            )
+
             payload = {
                 "model": model_name,
                 "prompt": prompt,
                 "stream": True,
-                "options": {
-                    "temperature": temperature,
-                    "num_predict": max_tokens,
-                    **kwargs
-                }
+                "options": options
             }
-            
+
             if system_prompt:
                 payload["system"] = system_prompt
             
             logger.debug(f"Generating streaming response with model: {model_name}")
             
-            async with self.session.post("/api/generate", json=payload) as response:
+            async with self.session.post("/api/generate", data=_json_dumps(payload)) as response:
                 if response.status != 200:
                     raise ModelError(f"Streaming generation failed: {response.status}")
                 
-                async for line in response.content:
-                    if line:
-                        try:
-                            data = json.loads(line.decode().strip())
-                            if "response" in data:
-                                yield data["response"]
-                        except json.JSONDecodeError:
-                            continue
+                async for data in _iter_json_lines(response.content):
+                    if "response" in data:
+                        yield data["response"]
                             
         except Exception as e:
             logger.error(f"Failed to generate streaming response: {e}")
@@ -230,31 +297,20 @@ class OllamaClient:
     ) -> str:
         """Chat with the model using message history."""
         try:
-            await self.connect()
-            
-            model_name = model_name or self.config.agent_model
-            temperature = temperature or self.config.temperature
-            max_tokens = max_tokens or self.config.max_tokens
-            
-            # Check if model is available
-            if not await self.is_model_available(model_name):
-                logger.info(f"Model {model_name} not available, pulling...")
-                await self.pull_model(model_name)
-            
+            model_name, options = await self._prepare_request(
+                model_name, temperature, max_tokens, **kwargs
+            )
+
             payload = {
                 "model": model_name,
                 "messages": messages,
                 "stream": False,
-                "options": {
-                    "temperature": temperature,
-                    "num_predict": max_tokens,
-                    **kwargs
-                }
+                "options": options
             }
             
             logger.debug(f"Chatting with model: {model_name}")
             
-            async with self.session.post("/api/chat", json=payload) as response:
+            async with self.session.post("/api/chat", data=_json_dumps(payload)) as response:
                 if response.status != 200:
                     raise ModelError(f"Chat failed: {response.status}")
                 
@@ -276,8 +332,9 @@ async def get_ollama_client() -> OllamaClient:
     """Get the global Ollama client instance."""
     global _ollama_client
     if _ollama_client is None:
+        # Construction only; every request path calls connect() itself, so
+        # the session is opened lazily on first use
         _ollama_client = OllamaClient()
-        await _ollama_client.connect()
     return _ollama_client
 
 
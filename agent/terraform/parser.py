@@ -2,8 +2,13 @@
 Terraform parser and analyzer for understanding Terraform code.
 """
 
+import os
 import re
 import json
+import sys
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from copy import deepcopy
 from pathlib import Path
 from typing import Dict, List, Optional, Any, Set, Tuple
 import hcl2
@@ -13,57 +18,202 @@ from ..core.exceptions import TerraformError
 
 logger = structlog.get_logger(__name__)
 
+try:
+    # Optional multi-pattern matcher for dependency scanning over large
+    # configurations; the compiled regex path is the fallback
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+try:
+    # Optional compiled HCL frontend (Go/Rust binding exposing parse() ->
+    # JSON bytes); hcl2's pure-Python lark grammar is the fallback
+    import hcl_native
+
+    def _hcl_loads(content: str) -> Dict[str, Any]:
+        return json.loads(hcl_native.parse(content))
+except ImportError:
+    _hcl_loads = hcl2.loads
+
+
+# Below this many files the process-pool startup costs more than it saves
+_PARALLEL_PARSE_THRESHOLD = 16
+
+# Parsed files kept per parser, evicted least-recently-used
+_PARSE_CACHE_SIZE = 1024
+
+
+def _parse_source_worker(item: Tuple[str, str]) -> Dict[str, Any]:
+    """Parse one (path, content) pair; picklable for worker processes."""
+    path, content = item
+    try:
+        return _parser.parse_source(content, path)
+    except Exception as e:
+        return {"__parse_error__": str(e), "file_path": path}
+
+
+# Tokens shaped like type.name (optionally data./module.-prefixed) inside
+# config string values; intersecting these with the known resource ids
+# replaces per-pair regex searches
+_REF_RE = re.compile(r'(?:data\.|module\.)?([A-Za-z_]\w*\.[A-Za-z_]\w*)')
+
+
+def _iter_str_leaves(value):
+    """Yield every string leaf nested inside a parsed config value.
+
+    References can only live in strings, so walking the structure directly
+    skips the json.dumps round-trip that serialized keys, numbers and
+    punctuation just to regex-scan them.
+    """
+    if isinstance(value, str):
+        yield value
+    elif isinstance(value, dict):
+        for item in value.values():
+            yield from _iter_str_leaves(item)
+    elif isinstance(value, list):
+        for item in value:
+            yield from _iter_str_leaves(item)
+
+
+# Directories never worth descending into when looking for Terraform files
+_PRUNED_DIRS = frozenset({'node_modules'})
+
+
+# (file_analysis key, summary set key, entry key) triples driving the
+# summary update loop; one spec instead of six copied if-blocks
+_SUMMARY_FIELDS = (
+    ("providers", "providers", "name"),
+    ("resources", "resources", "type"),
+    ("data_sources", "data_sources", "type"),
+    ("variables", "variables", "name"),
+    ("outputs", "outputs", "name"),
+    ("modules", "modules", "name"),
+)
+
+# Below this many resource ids the automaton build costs more than the
+# regex scan it replaces
+_AUTOMATON_MIN_IDS = 64
+
+# Providers whose resources are expected to carry tags; startswith takes
+# a tuple, so one call covers them all
+_TAG_REQUIRED_PREFIXES = ('aws_', 'azurerm_', 'google_')
+
+# Summary keys holding sets during analysis, converted to lists at the end
+_SUMMARY_SET_KEYS = (
+    "providers", "resources", "data_sources", "variables", "outputs", "modules"
+)
+
+
+def iter_terraform_paths(directory, extensions: Tuple[str, ...] = ('.tf',)):
+    """Yield Paths of Terraform files under directory.
+
+    Walks with os.scandir and prunes dot-directories (.git, .terraform)
+    and node_modules before descending, instead of rglob's full-tree
+    scan with per-entry Path construction.
+    """
+    stack = [str(directory)]
+    while stack:
+        current = stack.pop()
+        try:
+            entries = os.scandir(current)
+        except OSError:
+            continue
+        with entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    if not entry.name.startswith('.') and entry.name not in _PRUNED_DIRS:
+                        stack.append(entry.path)
+                elif entry.name.endswith(extensions) and entry.is_file(follow_symlinks=False):
+                    yield Path(entry.path)
+
 
 class TerraformParser:
     """Parser for Terraform configuration files."""
     
+    # Shared, immutable, so no per-instance copy
+    supported_extensions = frozenset({'.tf', '.tfvars', '.hcl'})
+
     def __init__(self):
-        self.supported_extensions = {'.tf', '.tfvars', '.hcl'}
-    
+        self._cache: "OrderedDict[Tuple[str, int, int], Dict[str, Any]]" = OrderedDict()
+
     def parse_file(self, file_path: str) -> Dict[str, Any]:
         """Parse a Terraform file and return structured data."""
         try:
             file_path_obj = Path(file_path)
             if not file_path_obj.exists():
                 raise TerraformError(f"File not found: {file_path}")
-            
+
             if file_path_obj.suffix not in self.supported_extensions:
                 raise TerraformError(f"Unsupported file type: {file_path}")
-            
-            content = file_path_obj.read_text(encoding='utf-8')
-            
-            if file_path_obj.suffix == '.tf':
+
+            # Unchanged files (same path, mtime and size) skip the parse
+            # entirely; callers get a private copy they may mutate
+            st = file_path_obj.stat()
+            key = (str(file_path_obj), st.st_mtime_ns, st.st_size)
+            cached = self._cache.get(key)
+            if cached is not None:
+                self._cache.move_to_end(key)
+                return deepcopy(cached)
+
+            # Read raw bytes with a large buffer and decode once; the
+            # default 8 KiB text buffering costs a read syscall per chunk
+            with open(file_path_obj, 'rb', buffering=131072) as f:
+                content = f.read().decode('utf-8')
+
+        except Exception as e:
+            raise TerraformError(f"Failed to parse file {file_path}: {e}")
+
+        result = self.parse_source(content, file_path)
+        self._cache[key] = deepcopy(result)
+        if len(self._cache) > _PARSE_CACHE_SIZE:
+            self._cache.popitem(last=False)
+        return result
+
+    def parse_source(self, content: str, file_path: str) -> Dict[str, Any]:
+        """Parse already-read Terraform source, dispatching on file suffix.
+
+        Lets callers that have walked and read a tree once feed contents
+        straight in without a second read per file.
+        """
+        try:
+            suffix = Path(file_path).suffix
+            if suffix == '.tf':
                 return self._parse_terraform_file(content, file_path)
-            elif file_path_obj.suffix == '.tfvars':
+            elif suffix == '.tfvars':
                 return self._parse_tfvars_file(content, file_path)
-            elif file_path_obj.suffix == '.hcl':
+            elif suffix == '.hcl':
                 return self._parse_hcl_file(content, file_path)
             else:
                 raise TerraformError(f"Unsupported file type: {file_path}")
-                
+
         except Exception as e:
             raise TerraformError(f"Failed to parse file {file_path}: {e}")
-    
+
+    @staticmethod
+    def _empty_tf_result(file_path: str) -> Dict[str, Any]:
+        """Build the empty .tf result skeleton shared by both parse branches."""
+        return {
+            "file_path": file_path,
+            "file_type": "terraform",
+            "providers": [],
+            "resources": [],
+            "data_sources": [],
+            "variables": [],
+            "outputs": [],
+            "locals": [],
+            "modules": [],
+            "terraform_blocks": [],
+            "errors": []
+        }
+
     def _parse_terraform_file(self, content: str, file_path: str) -> Dict[str, Any]:
         """Parse a .tf file."""
         try:
-            parsed = hcl2.loads(content)
+            parsed = _hcl_loads(content)
             logger.debug(f"HCL2 parsed content: {parsed}")
-            
-            result = {
-                "file_path": file_path,
-                "file_type": "terraform",
-                "providers": [],
-                "resources": [],
-                "data_sources": [],
-                "variables": [],
-                "outputs": [],
-                "locals": [],
-                "modules": [],
-                "terraform_blocks": [],
-                "errors": []
-            }
-            
+
+            result = self._empty_tf_result(file_path)
+
             # HCL2 returns a dictionary with block types as keys
             for block_type, block_content in parsed.items():
                 logger.debug(f"Block type: {block_type}, content: {block_content}")
@@ -89,39 +239,30 @@ class TerraformParser:
             
         except Exception as e:
             logger.error(f"Failed to parse Terraform file: {e}")
-            return {
-                "file_path": file_path,
-                "file_type": "terraform",
-                "error": str(e),
-                "providers": [],
-                "resources": [],
-                "data_sources": [],
-                "variables": [],
-                "outputs": [],
-                "locals": [],
-                "modules": [],
-                "terraform_blocks": []
-            }
+            result = self._empty_tf_result(file_path)
+            result["error"] = str(e)
+            return result
     
     def _parse_tfvars_file(self, content: str, file_path: str) -> Dict[str, Any]:
         """Parse a .tfvars file."""
         try:
-            parsed = hcl2.loads(content)
+            parsed = _hcl_loads(content)
             
-            result = {
+            # tfvars files contain variable assignments; merge into a local
+            # accumulator so the loop skips two dict lookups per block
+            variables = {}
+            update = variables.update
+            for block in parsed:
+                if type(block) is dict:
+                    update(block)
+
+            return {
                 "file_path": file_path,
                 "file_type": "tfvars",
-                "variables": {},
+                "variables": variables,
                 "errors": []
             }
             
-            # tfvars files contain variable assignments
-            for block in parsed:
-                if isinstance(block, dict):
-                    result["variables"].update(block)
-            
-            return result
-            
         except Exception as e:
             return {
                 "file_path": file_path,
@@ -133,7 +274,7 @@ class TerraformParser:
     def _parse_hcl_file(self, content: str, file_path: str) -> Dict[str, Any]:
         """Parse a .hcl file."""
         try:
-            parsed = hcl2.loads(content)
+            parsed = _hcl_loads(content)
             
             result = {
                 "file_path": file_path,
@@ -163,71 +304,92 @@ class TerraformParser:
     def _extract_providers(self, providers: List[Dict]) -> List[Dict]:
         """Extract provider configurations."""
         provider_list = []
-        for provider in providers:
-            if isinstance(provider, dict):
+        append = provider_list.append
+        intern = sys.intern
+        try:
+            for provider in providers:
                 for provider_name, config in provider.items():
-                    provider_list.append({
-                        "name": provider_name,
+                    append({
+                        "name": intern(provider_name),
                         "config": config
                     })
+        except AttributeError:
+            # HCL2 only ever emits dict blocks; tolerate a stray non-dict
+            logger.debug("Skipping malformed provider block")
         return provider_list
-    
+
     def _extract_resources(self, resources: List[Dict]) -> List[Dict]:
         """Extract resource configurations."""
         resource_list = []
-        for resource in resources:
-            if isinstance(resource, dict):
+        append = resource_list.append
+        intern = sys.intern
+        try:
+            for resource in resources:
                 # HCL2 structure: [{"aws_vpc": {"main": {"cidr_block": "10.0.0.0/16"}}}]
                 for resource_type, resource_blocks in resource.items():
-                    if isinstance(resource_blocks, dict):
-                        for resource_name, config in resource_blocks.items():
-                            resource_list.append({
-                                "type": resource_type,
-                                "name": resource_name,
-                                "config": config
-                            })
+                    resource_type = intern(resource_type)
+                    for resource_name, config in resource_blocks.items():
+                        append({
+                            "type": resource_type,
+                            "name": intern(resource_name),
+                            "config": config
+                        })
+        except AttributeError:
+            logger.debug("Skipping malformed resource block")
         return resource_list
-    
+
     def _extract_data_sources(self, data_sources: List[Dict]) -> List[Dict]:
         """Extract data source configurations."""
         data_list = []
-        for data_source in data_sources:
-            if isinstance(data_source, dict):
+        append = data_list.append
+        intern = sys.intern
+        try:
+            for data_source in data_sources:
                 # HCL2 structure: [{"aws_ami": {"ubuntu": {"most_recent": True}}}]
                 for data_type, data_blocks in data_source.items():
-                    if isinstance(data_blocks, dict):
-                        for data_name, config in data_blocks.items():
-                            data_list.append({
-                                "type": data_type,
-                                "name": data_name,
-                                "config": config
-                            })
+                    data_type = intern(data_type)
+                    for data_name, config in data_blocks.items():
+                        append({
+                            "type": data_type,
+                            "name": intern(data_name),
+                            "config": config
+                        })
+        except AttributeError:
+            logger.debug("Skipping malformed data block")
         return data_list
-    
+
     def _extract_variables(self, variables: List[Dict]) -> List[Dict]:
         """Extract variable declarations."""
         variable_list = []
-        for variable in variables:
-            if isinstance(variable, dict):
+        append = variable_list.append
+        intern = sys.intern
+        try:
+            for variable in variables:
                 # HCL2 structure: [{"region": {"description": "AWS region", "type": "string"}}]
                 for var_name, config in variable.items():
-                    variable_list.append({
-                        "name": var_name,
+                    append({
+                        "name": intern(var_name),
                         "config": config
                     })
+        except AttributeError:
+            logger.debug("Skipping malformed variable block")
         return variable_list
-    
+
     def _extract_outputs(self, outputs: List[Dict]) -> List[Dict]:
         """Extract output declarations."""
         output_list = []
-        for output in outputs:
-            if isinstance(output, dict):
+        append = output_list.append
+        intern = sys.intern
+        try:
+            for output in outputs:
                 # HCL2 structure: [{"vpc_id": {"value": "aws_vpc.main.id"}}]
                 for output_name, config in output.items():
-                    output_list.append({
-                        "name": output_name,
+                    append({
+                        "name": intern(output_name),
                         "config": config
                     })
+        except AttributeError:
+            logger.debug("Skipping malformed output block")
         return output_list
     
     def _extract_locals(self, locals_blocks: List[Dict]) -> List[Dict]:
@@ -241,13 +403,17 @@ class TerraformParser:
     def _extract_modules(self, modules: List[Dict]) -> List[Dict]:
         """Extract module declarations."""
         module_list = []
-        for module in modules:
-            if isinstance(module, dict):
+        append = module_list.append
+        intern = sys.intern
+        try:
+            for module in modules:
                 for module_name, config in module.items():
-                    module_list.append({
-                        "name": module_name,
+                    append({
+                        "name": intern(module_name),
                         "config": config
                     })
+        except AttributeError:
+            logger.debug("Skipping malformed module block")
         return module_list
 
 
@@ -255,17 +421,49 @@ class TerraformAnalyzer:
     """Analyzer for Terraform configurations."""
     
     def __init__(self):
-        self.parser = TerraformParser()
-    
+        # Share the module parser so every analyzer hits one parse cache
+        self.parser = _parser
+
     def analyze_directory(self, directory_path: str) -> Dict[str, Any]:
         """Analyze all Terraform files in a directory."""
         try:
             directory = Path(directory_path)
             if not directory.exists():
                 raise TerraformError(f"Directory not found: {directory_path}")
-            
+
+            # Find and read all Terraform files once; one pruned scandir walk
+            # replaces two full rglob passes over the tree
+            terraform_files = iter_terraform_paths(directory, ('.tf', '.tfvars'))
+
+            files = []
+            read_errors = []
+            for file_path in terraform_files:
+                try:
+                    files.append((file_path, file_path.read_text(encoding='utf-8')))
+                except Exception as e:
+                    read_errors.append({
+                        "file": str(file_path),
+                        "error": f"Failed to parse file {file_path}: {e}"
+                    })
+
+            analysis = self.analyze_contents(directory_path, files)
+            analysis["errors"].extend(read_errors)
+            return analysis
+
+        except TerraformError:
+            raise
+        except Exception as e:
+            raise TerraformError(f"Failed to analyze directory {directory_path}: {e}")
+
+    def analyze_contents(self, directory_path: str, files) -> Dict[str, Any]:
+        """Analyze already-read Terraform sources as one directory.
+
+        files is a sequence of (path, content) pairs; callers that have
+        already walked and read the tree avoid a second full read pass.
+        """
+        try:
             analysis = {
-                "directory": str(directory),
+                "directory": str(Path(directory_path)),
                 "files": [],
                 "summary": {
                     "total_files": 0,
@@ -284,31 +482,35 @@ class TerraformAnalyzer:
                 "errors": []
             }
             
-            # Find all Terraform files
-            terraform_files = list(directory.rglob("*.tf")) + list(directory.rglob("*.tfvars"))
-            
-            for file_path in terraform_files:
-                try:
-                    file_analysis = self.parser.parse_file(str(file_path))
-                    analysis["files"].append(file_analysis)
-                    analysis["summary"]["total_files"] += 1
-                    
-                    # Update summary
-                    self._update_summary(analysis["summary"], file_analysis)
-                    
-                except Exception as e:
+            items = [(str(file_path), content) for file_path, content in files]
+            if len(items) >= _PARALLEL_PARSE_THRESHOLD:
+                # hcl2 is a pure-Python lark parser, so real parallelism
+                # needs worker processes; files parse independently
+                with ProcessPoolExecutor() as executor:
+                    parsed = list(executor.map(_parse_source_worker, items, chunksize=8))
+            else:
+                parsed = [_parse_source_worker(item) for item in items]
+
+            for file_analysis in parsed:
+                if "__parse_error__" in file_analysis:
                     analysis["errors"].append({
-                        "file": str(file_path),
-                        "error": str(e)
+                        "file": file_analysis["file_path"],
+                        "error": file_analysis["__parse_error__"]
                     })
-            
+                    continue
+                analysis["files"].append(file_analysis)
+                analysis["summary"]["total_files"] += 1
+
+                # Update summary
+                self._update_summary(analysis["summary"], file_analysis)
+
             # Analyze dependencies
             analysis["dependencies"] = self._analyze_dependencies(analysis["files"])
             
             # Convert sets to lists for JSON serialization and update counts
-            for key in analysis["summary"]:
-                if isinstance(analysis["summary"][key], set):
-                    analysis["summary"][key] = list(analysis["summary"][key])
+            summary = analysis["summary"]
+            for key in _SUMMARY_SET_KEYS:
+                summary[key] = list(summary[key])
             
             # Update total counts
             analysis["summary"]["total_resources"] = len(analysis["summary"]["resources"])
@@ -323,29 +525,13 @@ class TerraformAnalyzer:
     
     def _update_summary(self, summary: Dict[str, Any], file_analysis: Dict[str, Any]):
         """Update analysis summary with file data."""
-        if "providers" in file_analysis:
-            for provider in file_analysis["providers"]:
-                summary["providers"].add(provider.get("name", "unknown"))
-        
-        if "resources" in file_analysis:
-            for resource in file_analysis["resources"]:
-                summary["resources"].add(resource.get("type", "unknown"))
-        
-        if "data_sources" in file_analysis:
-            for data_source in file_analysis["data_sources"]:
-                summary["data_sources"].add(data_source.get("type", "unknown"))
-        
-        if "variables" in file_analysis:
-            for variable in file_analysis["variables"]:
-                summary["variables"].add(variable.get("name", "unknown"))
-        
-        if "outputs" in file_analysis:
-            for output in file_analysis["outputs"]:
-                summary["outputs"].add(output.get("name", "unknown"))
-        
-        if "modules" in file_analysis:
-            for module in file_analysis["modules"]:
-                summary["modules"].add(module.get("name", "unknown"))
+        get = file_analysis.get
+        for file_key, summary_key, entry_key in _SUMMARY_FIELDS:
+            entries = get(file_key)
+            if entries:
+                add = summary[summary_key].add
+                for entry in entries:
+                    add(entry.get(entry_key, "unknown"))
     
     def _analyze_dependencies(self, files: List[Dict[str, Any]]) -> Dict[str, Any]:
         """Analyze dependencies between Terraform resources."""
@@ -354,51 +540,52 @@ class TerraformAnalyzer:
             "module_dependencies": {},
             "variable_dependencies": {}
         }
-        
-        # Build resource dependency graph
-        for file_analysis in files:
-            if "resources" in file_analysis:
-                for resource in file_analysis["resources"]:
-                    resource_id = f"{resource['type']}.{resource['name']}"
-                    dependencies["resource_dependencies"][resource_id] = self._find_resource_dependencies(
-                        resource, files
-                    )
-        
-        return dependencies
-    
-    def _find_resource_dependencies(self, resource: Dict[str, Any], files: List[Dict[str, Any]]) -> List[str]:
-        """Find dependencies for a specific resource."""
-        dependencies = []
-        resource_config = resource.get("config", {})
-        
-        # Look for references to other resources
-        for file_analysis in files:
-            if "resources" in file_analysis:
-                for other_resource in file_analysis["resources"]:
-                    other_id = f"{other_resource['type']}.{other_resource['name']}"
-                    
-                    # Check if this resource references the other resource
-                    if self._resource_references_other(resource_config, other_id):
-                        dependencies.append(other_id)
-        
-        return dependencies
-    
-    def _resource_references_other(self, config: Dict[str, Any], resource_id: str) -> bool:
-        """Check if a resource configuration references another resource."""
-        config_str = json.dumps(config)
-        
-        # Look for references like aws_instance.web.id or module.vpc.vpc_id
-        patterns = [
-            rf"{resource_id}\.",
-            rf"data\.{resource_id}\.",
-            rf"module\.{resource_id}\."
+
+        # Single pass: collect every resource id up front, then tokenize
+        # each config once and intersect the tokens with the id set,
+        # instead of one regex search per (resource, other) pair
+        all_resources = [
+            resource
+            for file_analysis in files if "resources" in file_analysis
+            for resource in file_analysis["resources"]
         ]
-        
-        for pattern in patterns:
-            if re.search(pattern, config_str):
-                return True
-        
-        return False
+        all_ids = {f"{r['type']}.{r['name']}" for r in all_resources}
+
+        automaton = None
+        if ahocorasick is not None and len(all_ids) >= _AUTOMATON_MIN_IDS:
+            # One automaton pass per leaf matches every id simultaneously,
+            # instead of regex-tokenizing the leaf and intersecting
+            automaton = ahocorasick.Automaton()
+            for rid in all_ids:
+                automaton.add_word(rid, rid)
+            automaton.make_automaton()
+
+        resource_deps = dependencies["resource_dependencies"]
+        finditer = _REF_RE.finditer
+        for resource in all_resources:
+            resource_id = f"{resource['type']}.{resource['name']}"
+            if automaton is not None:
+                refs = set()
+                add = refs.add
+                for leaf in _iter_str_leaves(resource.get("config", {})):
+                    for end, rid in automaton.iter(leaf):
+                        # Reject matches embedded in a longer identifier
+                        start = end - len(rid) + 1
+                        if start and (leaf[start - 1].isalnum() or leaf[start - 1] == '_'):
+                            continue
+                        after = end + 1
+                        if after < len(leaf) and (leaf[after].isalnum() or leaf[after] == '_'):
+                            continue
+                        add(rid)
+            else:
+                refs = {
+                    m.group(1)
+                    for leaf in _iter_str_leaves(resource.get("config", {}))
+                    for m in finditer(leaf)
+                } & all_ids
+            resource_deps[resource_id] = sorted(refs)
+
+        return dependencies
     
     def validate_configuration(self, file_path: str) -> Dict[str, Any]:
         """Validate a Terraform configuration file."""
@@ -447,7 +634,7 @@ class TerraformAnalyzer:
         config = resource.get("config", {})
         
         # Check for required fields based on resource type
-        if resource_type.startswith("aws_"):
+        if resource_type.startswith(_TAG_REQUIRED_PREFIXES):
             if "tags" not in config:
                 validation["warnings"].append(f"Resource {resource['name']} should have tags")
         
@@ -0,0 +1,35 @@
+#!/bin/bash
+
+# X-Terraform Agent Zipapp Builder
+# Version: 0.0.1
+# Description: Build a single-file executable zipapp with shiv.
+#
+# A zipapp starts noticeably faster than the unpacked source tree because
+# the interpreter resolves imports from one zip instead of thousands of
+# directory stats. For the biggest startup win, run this under a CPython
+# built with --enable-optimizations --with-lto (PGO+LTO), which is what
+# the python.org and distro release binaries already use.
+
+set -e
+
+SCRIPT_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)"
+AGENT_DIR="$(dirname "$SCRIPT_DIR")"
+DIST_DIR="$AGENT_DIR/dist"
+VERSION="0.0.1"
+OUTPUT="$DIST_DIR/x-terraform-agent-v${VERSION}.pyz"
+
+if ! command -v shiv >/dev/null 2>&1; then
+    echo "shiv is required: pip install shiv" >&2
+    exit 1
+fi
+
+mkdir -p "$DIST_DIR"
+
+echo "Building zipapp: $OUTPUT"
+shiv \
+    --console-script terraform-agent \
+    --output-file "$OUTPUT" \
+    --compressed \
+    "$AGENT_DIR"
+
+echo "Done. Run it with: $OUTPUT --help"
@@ -56,7 +56,7 @@ setup(
     },
     entry_points={
         "console_scripts": [
-            "terraform-agent=agent.main:main",
+            "terraform-agent=agent.main:run",
         ],
     },
     include_package_data=True,
@@ -9,7 +9,7 @@ from agent.core.agent import TerraformAgent
 from agent.core.config import get_config
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def config():
     """Get test configuration."""
     return get_config()
@@ -2,10 +2,12 @@
 Integration tests for the Terraform Agent.
 """
 
+import copy
+import git
+import hashlib
 import pytest
+import pytest_asyncio
 import asyncio
-import tempfile
-import shutil
 from pathlib import Path
 from unittest.mock import Mock, patch, AsyncMock
 
@@ -16,14 +18,9 @@ from agent.terraform.parser import TerraformParser, TerraformAnalyzer
 from agent.models.ollama_client import OllamaClient
 
 
-@pytest.fixture
-def temp_workspace():
-    """Create a temporary workspace with Terraform files."""
-    temp_dir = tempfile.mkdtemp()
-    
-    # Create sample Terraform files
-    main_tf = Path(temp_dir) / "main.tf"
-    main_tf.write_text("""
+# Workspace sources as byte constants, encoded once at import instead of
+# per fixture invocation
+_MAIN_TF = b"""
 terraform {
   required_version = ">= 1.0"
   required_providers {
@@ -54,10 +51,9 @@ resource "aws_subnet" "public" {
     Name = "public-subnet"
   }
 }
-""")
-    
-    variables_tf = Path(temp_dir) / "variables.tf"
-    variables_tf.write_text("""
+"""
+
+_VARIABLES_TF = b"""
 variable "region" {
   description = "AWS region"
   type        = string
@@ -69,10 +65,9 @@ variable "environment" {
   type        = string
   default     = "dev"
 }
-""")
-    
-    outputs_tf = Path(temp_dir) / "outputs.tf"
-    outputs_tf.write_text("""
+"""
+
+_OUTPUTS_TF = b"""
 output "vpc_id" {
   description = "VPC ID"
   value       = aws_vpc.main.id
@@ -82,108 +77,171 @@ output "subnet_id" {
   description = "Public subnet ID"
   value       = aws_subnet.public.id
 }
-""")
-    
-    yield temp_dir
-    
-    # Cleanup
-    shutil.rmtree(temp_dir)
+"""
+
+_WORKSPACE_FILES = (
+    ("main.tf", _MAIN_TF),
+    ("variables.tf", _VARIABLES_TF),
+    ("outputs.tf", _OUTPUTS_TF),
+)
+
+# Canonical digest per file: one equality against this catches any
+# content drift, unlike spot substring checks
+_WORKSPACE_DIGESTS = {
+    name: hashlib.blake2b(data, digest_size=8).digest()
+    for name, data in _WORKSPACE_FILES
+}
+
+
+@pytest.fixture(scope="session")
+def temp_workspace(tmp_path_factory):
+    """Create a temporary workspace with Terraform files, once per session."""
+    root = tmp_path_factory.mktemp("tf_workspace")
+    for name, data in _WORKSPACE_FILES:
+        (root / name).write_bytes(data)
+    return str(root)
+
+
+@pytest.fixture(scope="module")
+def git_workspace(temp_workspace):
+    """Initialize the shared workspace as a git repository, once per module."""
+    repo = git.Repo.init(temp_workspace)
+    repo.index.add([name for name, _ in _WORKSPACE_FILES])
+    repo.index.commit("Initial commit")
+    return temp_workspace
+
+
+@pytest.fixture(scope="module")
+def git_repo(git_workspace):
+    """One GitRepository handle over the initialized workspace.
+
+    Opening a repo enumerates refs and reads HEAD; constructing it once
+    lets every read-only git test reuse the handle.
+    """
+    return GitRepository(git_workspace)
+
+
+@pytest.fixture(scope="session")
+def config():
+    """Resolve the global configuration once for the session."""
+    return get_config()
+
+
+@pytest.fixture(scope="session")
+def parser():
+    """One parser for the whole session; it keeps no per-test state."""
+    return TerraformParser()
+
+
+@pytest.fixture(scope="session")
+def analyzer():
+    """One analyzer for the whole session; it keeps no per-test state."""
+    return TerraformAnalyzer()
+
+
+@pytest.fixture(scope="session")
+def parsed_workspace(parser, temp_workspace):
+    """Parse each workspace file once and share the results by name."""
+    return {
+        name: parser.parse_file(str(Path(temp_workspace) / name))
+        for name, _ in _WORKSPACE_FILES
+    }
+
+
+# Mock(spec=...) walks the target class with inspect on every call; build
+# the spec'd prototype once and hand each test a reset shallow copy
+_OLLAMA_PROTO = Mock(spec=OllamaClient)
+_OLLAMA_PROTO.health_check = AsyncMock(return_value=True)
+_OLLAMA_PROTO.generate = AsyncMock(return_value="Mock AI response")
+_OLLAMA_PROTO.disconnect = AsyncMock()
 
 
 @pytest.fixture
 def mock_ollama_client():
-    """Mock Ollama client."""
-    with patch('agent.models.ollama_client.OllamaClient') as mock_client:
-        mock_instance = Mock(spec=OllamaClient)
-        mock_instance.health_check = AsyncMock(return_value=True)
-        mock_instance.generate = AsyncMock(return_value="Mock AI response")
-        mock_instance.disconnect = AsyncMock()
-        mock_client.return_value = mock_instance
+    """Mock Ollama client.
+
+    The patch is load-bearing: agent.start() resolves its client through
+    get_ollama_client(), so patching that name where the agent imported it
+    routes the agent to the mock instead of a live server, even when an
+    earlier test already populated the module's client singleton.
+    """
+    mock_instance = copy.copy(_OLLAMA_PROTO)
+    mock_instance.reset_mock()
+    with patch('agent.core.agent.get_ollama_client',
+               AsyncMock(return_value=mock_instance)):
         yield mock_instance
 
 
-@pytest.fixture
-def agent_with_mocks(mock_ollama_client, temp_workspace):
-    """Create agent with mocked dependencies."""
-    with patch('agent.git.repository.GitRepository') as mock_repo_class:
-        mock_repo = Mock(spec=GitRepository)
-        mock_repo.repo_path = Path(temp_workspace)
-        mock_repo.get_repository_info.return_value = {
-            "path": temp_workspace,
+class _StubRepo:
+    """Hand-rolled repository stand-in; skips Mock spec introspection."""
+
+    def __init__(self, path):
+        self.repo_path = Path(path)
+
+    def get_repository_info(self):
+        return {
+            "path": str(self.repo_path),
             "branch": "main",
             "commit": "test-commit",
             "is_dirty": False
         }
-        mock_repo.find_terraform_files.return_value = [
-            {"path": "main.tf", "absolute_path": f"{temp_workspace}/main.tf"},
-            {"path": "variables.tf", "absolute_path": f"{temp_workspace}/variables.tf"},
-            {"path": "outputs.tf", "absolute_path": f"{temp_workspace}/outputs.tf"}
+
+    def find_terraform_files(self):
+        return [
+            {"path": name, "absolute_path": str(self.repo_path / name)}
+            for name, _ in _WORKSPACE_FILES
         ]
-        mock_repo_class.return_value = mock_repo
-        
-        agent = TerraformAgent()
-        agent.repository = mock_repo
-        return agent
 
 
+@pytest.fixture
+def agent_with_mocks(mock_ollama_client, temp_workspace):
+    """Create agent with mocked dependencies."""
+    agent = TerraformAgent()
+    agent.repository = _StubRepo(temp_workspace)
+    return agent
+
+
+@pytest_asyncio.fixture
+async def started_agent(agent_with_mocks):
+    """Agent started before the test and stopped after it."""
+    await agent_with_mocks.start()
+    yield agent_with_mocks
+    await agent_with_mocks.stop()
+
+
+@pytest.mark.xdist_group(name="parser")
 class TestTerraformParser:
     """Test Terraform parser functionality."""
     
-    def test_parse_terraform_file(self, temp_workspace):
-        """Test parsing a Terraform file."""
-        parser = TerraformParser()
-        main_tf = Path(temp_workspace) / "main.tf"
-        
-        result = parser.parse_file(str(main_tf))
-        
-        assert result["file_type"] == "terraform"
-        assert len(result["resources"]) == 2  # vpc and subnet
-        assert len(result["providers"]) == 1  # aws provider
-        assert len(result["terraform_blocks"]) == 1
-        assert "errors" not in result or not result["errors"]
-    
-    def test_parse_variables_file(self, temp_workspace):
-        """Test parsing a variables file."""
-        parser = TerraformParser()
-        variables_tf = Path(temp_workspace) / "variables.tf"
-        
-        result = parser.parse_file(str(variables_tf))
-        
-        assert result["file_type"] == "terraform"
-        assert len(result["variables"]) == 2  # region and environment
-        assert "errors" not in result or not result["errors"]
-    
-    def test_parse_outputs_file(self, temp_workspace):
-        """Test parsing an outputs file."""
-        parser = TerraformParser()
-        outputs_tf = Path(temp_workspace) / "outputs.tf"
-        
-        result = parser.parse_file(str(outputs_tf))
-        
+    @pytest.mark.parametrize("filename,expected_counts", [
+        ("main.tf", {"resources": 2, "providers": 1, "terraform_blocks": 1}),
+        ("variables.tf", {"variables": 2}),  # region and environment
+        ("outputs.tf", {"outputs": 2}),  # vpc_id and subnet_id
+    ])
+    def test_parse_file(self, parsed_workspace, filename, expected_counts):
+        """Test parsing each workspace file."""
+        result = parsed_workspace[filename]
+
         assert result["file_type"] == "terraform"
-        assert len(result["outputs"]) == 2  # vpc_id and subnet_id
+        for key, count in expected_counts.items():
+            assert len(result[key]) == count
         assert "errors" not in result or not result["errors"]
 
 
+@pytest.mark.xdist_group(name="analyzer")
 class TestTerraformAnalyzer:
     """Test Terraform analyzer functionality."""
     
-    def test_analyze_directory(self, temp_workspace):
+    def test_analyze_directory(self, analyzer, temp_workspace):
         """Test analyzing a directory of Terraform files."""
-        analyzer = TerraformAnalyzer()
-        
         result = analyzer.analyze_directory(temp_workspace)
-        
-        assert "summary" in result
-        assert "files" in result
-        assert "dependencies" in result
-        assert result["summary"]["total_files"] == 3
-        assert result["summary"]["total_resources"] == 2
-        assert result["summary"]["total_providers"] == 1
+
+        assert {"summary", "files", "dependencies"} <= result.keys()
+        expected = {"total_files": 3, "total_resources": 2, "total_providers": 1}
+        assert {key: result["summary"][key] for key in expected} == expected
     
-    def test_validate_configuration(self, temp_workspace):
+    def test_validate_configuration(self, analyzer, temp_workspace):
         """Test configuration validation."""
-        analyzer = TerraformAnalyzer()
         main_tf = Path(temp_workspace) / "main.tf"
         
         result = analyzer.validate_configuration(str(main_tf))
@@ -194,47 +252,34 @@ class TestTerraformAnalyzer:
         assert "best_practices" in result
 
 
+@pytest.mark.xdist_group(name="git")
 class TestGitRepository:
     """Test Git repository integration."""
     
-    def test_repository_initialization(self, temp_workspace):
+    def test_repository_initialization(self, git_workspace):
         """Test repository initialization."""
-        # Create a git repository
-        import git
-        repo = git.Repo.init(temp_workspace)
-        
-        # Add files to git
-        repo.index.add(["main.tf", "variables.tf", "outputs.tf"])
-        repo.index.commit("Initial commit")
-        
-        git_repo = GitRepository(temp_workspace)
-        
+        git_repo = GitRepository(git_workspace)
+
         assert git_repo.repo is not None
-        assert git_repo.repo_path == Path(temp_workspace)
-    
-    def test_find_terraform_files(self, temp_workspace):
+        assert git_repo.repo_path == Path(git_workspace)
+
+    def test_find_terraform_files(self, git_repo):
         """Test finding Terraform files."""
-        git_repo = GitRepository(temp_workspace)
-        
         files = git_repo.find_terraform_files()
-        
+
         assert len(files) == 3
-        file_paths = [f["path"] for f in files]
-        assert "main.tf" in file_paths
-        assert "variables.tf" in file_paths
-        assert "outputs.tf" in file_paths
-    
-    def test_get_file_content(self, temp_workspace):
+        assert {f["path"] for f in files} == {name for name, _ in _WORKSPACE_FILES}
+
+    def test_get_file_content(self, git_repo):
         """Test getting file content."""
-        git_repo = GitRepository(temp_workspace)
-        
         content = git_repo.get_file_content("main.tf")
-        
+
         assert content is not None
-        assert "aws_vpc" in content
-        assert "aws_subnet" in content
+        digest = hashlib.blake2b(content.encode(), digest_size=8).digest()
+        assert digest == _WORKSPACE_DIGESTS["main.tf"]
 
 
+@pytest.mark.xdist_group(name="agent")
 class TestTerraformAgent:
     """Test Terraform Agent functionality."""
     
@@ -248,22 +293,14 @@ class TestTerraformAgent:
         assert agent.repository is not None
     
     @pytest.mark.asyncio
-    async def test_agent_start_stop(self, agent_with_mocks, mock_ollama_client):
+    async def test_agent_start_stop(self, started_agent):
         """Test agent start and stop."""
-        agent = agent_with_mocks
-        
-        await agent.start()
-        assert agent.ollama_client is not None
-        
-        await agent.stop()
-    
+        assert started_agent.ollama_client is not None
+
     @pytest.mark.asyncio
-    async def test_process_query(self, agent_with_mocks, mock_ollama_client):
+    async def test_process_query(self, started_agent):
         """Test processing a query."""
-        agent = agent_with_mocks
-        await agent.start()
-        
-        result = await agent.process_query("Create a VPC with public and private subnets")
+        result = await started_agent.process_query("Create a VPC with public and private subnets")
         
         assert "response" in result
         assert "actions" in result
@@ -297,28 +334,23 @@ class TestTerraformAgent:
         assert "warnings" in result
 
 
+@pytest.mark.xdist_group(name="config")
 class TestConfiguration:
     """Test configuration management."""
     
-    def test_config_loading(self):
+    def test_config_loading(self, config):
         """Test configuration loading."""
-        config = get_config()
-        
         assert config.agent_model == "codellama:7b-instruct"
         assert config.temperature == 0.7
         assert config.max_tokens == 4096
         assert config.require_approval is True
     
-    def test_config_validation(self):
+    def test_config_validation(self, config):
         """Test configuration validation."""
-        config = get_config()
-        
         assert config.validate() is True
     
-    def test_config_to_dict(self):
+    def test_config_to_dict(self, config):
         """Test configuration serialization."""
-        config = get_config()
-        
         config_dict = config.to_dict()
         
         assert "agent_model" in config_dict
@@ -326,6 +358,7 @@ class TestConfiguration:
         assert "max_tokens" in config_dict
 
 
+@pytest.mark.xdist_group(name="ollama")
 class TestOllamaClient:
     """Test Ollama client functionality."""
     